@@ -237,10 +237,10 @@ class ExampleMapAgent(BaseAgent):
         example_edges = example_map.get("edges", [])
         
         # Convert edges to a comparable format
-        student_edge_tuples = {(edge.get("source", ""), edge.get("target", ""), edge.get("relation", "")) 
+        student_edge_tuples = {(edge.get("source", ""), edge.get("target", ""), edge.get("relation", ""))
                               for edge in student_edges if edge.get("source") and edge.get("target")}
         
-        example_edge_tuples = {(edge.get("source", ""), edge.get("target", ""), edge.get("relation", "")) 
+        example_edge_tuples = {(edge.get("source", ""), edge.get("target", ""), edge.get("relation", ""))
                               for edge in example_edges if edge.get("source") and edge.get("target")}
         
         # Find matching and missing elements
@@ -252,12 +252,17 @@ class ExampleMapAgent(BaseAgent):
         missing_edges = example_edge_tuples - student_edge_tuples
         extra_edges = student_edge_tuples - example_edge_tuples
         
-        # Check for similar but not exact matches in relationships
+        # Check for similar but not exact matches in relationships:
+        # index expert edges by (source, target) so each student edge is one lookup
+        example_edges_by_pair = {}
+        for e_edge in example_edge_tuples:
+            example_edges_by_pair.setdefault(e_edge[:2], []).append(e_edge)
+
         similar_edges = set()
         for s_edge in student_edge_tuples:
-            for e_edge in example_edge_tuples:
-                # If source and target match but relation is different
-                if s_edge[0] == e_edge[0] and s_edge[1] == e_edge[1] and s_edge[2] != e_edge[2]:
+            for e_edge in example_edges_by_pair.get(s_edge[:2], ()):
+                # Source and target match but relation is different
+                if s_edge[2] != e_edge[2]:
                     similar_edges.add((s_edge, e_edge))
         
         # Calculate coverage percentages
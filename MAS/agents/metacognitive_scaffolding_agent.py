@@ -580,7 +580,7 @@ class MetacognitiveScaffoldingAgent(BaseAgent):
             focus = "monitoring"
         
         # Generate prompts using utility function
-        prompts = generate_default_prompts("metacognitive", intensity, analysis)
+        prompts, _ = generate_default_prompts("metacognitive", intensity, analysis)
         
         # If no prompts were generated, use templates from reflection prompts
         if not prompts:
@@ -11,7 +11,7 @@ from typing import Dict, List, Any, Optional, Callable
 
 from MAS.agents.base_agent import BaseAgent
 from MAS.config.scaffolding_config import DEFAULT_SCAFFOLDING_CONFIG, SCAFFOLDING_FOLLOWUP_TEMPLATES
-from MAS.utils.scaffolding_utils import analyze_concept_map, generate_default_prompts
+from MAS.utils.scaffolding_utils import analyze_concept_map, generate_default_prompts, render_template
 
 logger = logging.getLogger(__name__)
 
@@ -524,7 +524,7 @@ class StrategicScaffoldingAgent(BaseAgent):
         logger.info(f"Generating strategic scaffolding prompts at {intensity} intensity")
         
         # Generate prompts using utility function
-        prompts = generate_default_prompts("strategic", intensity, analysis)
+        prompts, _ = generate_default_prompts("strategic", intensity, analysis)
         
         # If no prompts were generated, use templates from config
         if not prompts:
@@ -542,21 +542,16 @@ class StrategicScaffoldingAgent(BaseAgent):
         # Format prompts with map analysis data if needed
         formatted_prompts = []
         map_analysis = analysis.get("map_analysis", {})
+        format_fields = {
+            "node_count": map_analysis.get("node_count", 0),
+            "edge_count": map_analysis.get("edge_count", 0),
+            "connectivity_ratio": map_analysis.get("connectivity_ratio", 0),
+            "isolated_node_count": map_analysis.get("isolated_node_count", 0)
+        }
         
         for prompt in prompts:
-            try:
-                # Format the prompt with map analysis data
-                formatted_prompt = prompt.format(
-                    node_count=map_analysis.get("node_count", 0),
-                    edge_count=map_analysis.get("edge_count", 0),
-                    connectivity_ratio=map_analysis.get("connectivity_ratio", 0),
-                    isolated_node_count=map_analysis.get("isolated_node_count", 0)
-                )
-                
-                formatted_prompts.append(formatted_prompt)
-            except KeyError:
-                # If formatting fails, use the prompt as is
-                formatted_prompts.append(prompt)
+            # Format the prompt with map analysis data; unknown fields stay as is
+            formatted_prompts.append(render_template(prompt, **format_fields))
         
         return {
             "prompts": formatted_prompts,
@@ -10,19 +10,30 @@ from streamlit.runtime.state import session_state
 from streamlit_experimental_session import StreamlitExperimentalSession
 from task_content import (
     STUDY_TITLE, STUDY_INTRODUCTION, TASK_DESCRIPTION,
-    EXTRA_MATERIALS, INITIAL_CONCEPT_MAP
+    EXTRA_MATERIALS, INITIAL_CONCEPT_MAP_JSON
 )
-from text_to_image import render_protected_markdown
+from text_to_image import render_protected_markdown, prerender_protected_markdown
 from streamlit_scroll_to_top import scroll_to_here
 
 logger = logging.getLogger(__name__)
 
+# Size of the protected task/material images; the prerender in
+# init_session_state must match the dialogs to hit the same cache entry
+PROTECTED_TEXT_WIDTH = 1100
+PROTECTED_FONT_SIZE = 20
+
 
 # Session State Initialization
 def init_session_state():
     """Initialize session state with experimental session support."""
     if "contents" not in st.session_state:
         st.session_state.contents = load_contents()
+        # Draw the protected dialog texts while the participant is still on
+        # the intro pages
+        prerender_protected_markdown(
+            (TASK_DESCRIPTION, EXTRA_MATERIALS),
+            width=PROTECTED_TEXT_WIDTH, font_size=PROTECTED_FONT_SIZE
+        )
 
     # Auto Scroll
     if 'scroll_to_top' not in st.session_state:
@@ -73,7 +84,12 @@ def load_contents():
     """Load contents configuration."""
     path = os.path.join(os.path.dirname(__file__), "contents.json")
     with open(path) as f:
-        return json.load(f)
+        contents = json.load(f)
+
+    # task_content is the single source of the initial map; decode a fresh
+    # copy so that per-session edits never leak into the module constant
+    contents.setdefault("initial_map", json.loads(INITIAL_CONCEPT_MAP_JSON))
+    return contents
 
 
 def get_current_round_data(round_num):
@@ -493,7 +509,7 @@ def render_agent_differentiation_question():
                 }
 
                 # Add to session data
-                st.session_state.experimental_session.session_data["agent_differentiation"] = differentiation_data
+                st.session_state.experimental_session.session_data.agent_differentiation = differentiation_data
 
                 # Log the response
                 if st.session_state.experimental_session.session_logger:
@@ -554,7 +570,7 @@ def render_map_adaption_question():
                                                                              'Unknown') if st.session_state.learner_profile else 'Unknown'
                 }
 
-                st.session_state.experimental_session.session_data["map_adaptation"] = adaptation_data
+                st.session_state.experimental_session.session_data.map_adaptation = adaptation_data
 
                 if st.session_state.experimental_session.session_logger:
                     st.session_state.experimental_session.session_logger.log_event(
@@ -581,7 +597,7 @@ def render_summary_page():
     final_edges = 0
 
     if st.session_state.experimental_session:
-        final_map = st.session_state.experimental_session.session_data.get("current_concept_map", {})
+        final_map = st.session_state.experimental_session.session_data.current_concept_map
         final_nodes = len(final_map.get("concepts", []))
         final_edges = len(final_map.get("relationships", []))
 
@@ -729,7 +745,7 @@ def render_task_dialog():
     st.caption("This content is protected and cannot be copied.")
 
     # Render task description as protected image with larger font
-    render_protected_markdown(TASK_DESCRIPTION, width=1100, font_size=20)
+    render_protected_markdown(TASK_DESCRIPTION, width=PROTECTED_TEXT_WIDTH, font_size=PROTECTED_FONT_SIZE)
 
 
 @st.dialog("Extra Materials", width='large')
@@ -739,7 +755,7 @@ def render_materials_dialog():
     st.caption("This content is protected and cannot be copied.")
 
     # Render extra materials as protected image with larger font
-    render_protected_markdown(EXTRA_MATERIALS, width=1100, font_size=20)
+    render_protected_markdown(EXTRA_MATERIALS, width=PROTECTED_TEXT_WIDTH, font_size=PROTECTED_FONT_SIZE)
 
 
 @st.dialog("How to use a concept map creator?", width='large')
@@ -1025,6 +1041,17 @@ def render_followup():
             st.warning("⚠️ This is your final exchange for this round. Click 'Finish Round' to proceed.")
 
 
+_NO_DATA = {}
+
+
+def split_elements(elements):
+    """Split concept map elements into (nodes, edges) in a single pass."""
+    nodes, edges = [], []
+    for e in elements:
+        (edges if "source" in (e.get("data") or _NO_DATA) else nodes).append(e)
+    return nodes, edges
+
+
 def capture_concept_map_data(roundn: int, concept_map_response: Dict) -> None:
     """Capture concept map data for experimental analysis with comprehensive logging."""
 
@@ -1049,8 +1076,7 @@ def capture_concept_map_data(roundn: int, concept_map_response: Dict) -> None:
         else:
             dict_elements = [e for e in elements if isinstance(e, dict)]
 
-        nodes = [e for e in dict_elements if "source" not in e.get("data", {})]
-        edges = [e for e in dict_elements if "source" in e.get("data", {})]
+        nodes, edges = split_elements(dict_elements)
 
         st.session_state.experimental_session.session_logger.log_event(
             event_type="concept_map_captured",
@@ -1065,7 +1091,7 @@ def capture_concept_map_data(roundn: int, concept_map_response: Dict) -> None:
                 "capture_timestamp": datetime.now().isoformat(),
                 "experimental_data": {
                     "concept_map_data": concept_map_response,
-                    "session_id": st.session_state.experimental_session.session_data["session_id"]
+                    "session_id": st.session_state.experimental_session.session_data.session_id
                 }
             }
         )
@@ -1078,8 +1104,8 @@ def get_current_agent_type(roundn: int) -> Optional[str]:
 
     agent_index = roundn - 1
     if (st.session_state.experimental_session and
-            agent_index < len(st.session_state.experimental_session.session_data.get("agent_sequence", []))):
-        return st.session_state.experimental_session.session_data["agent_sequence"][agent_index]
+            agent_index < len(st.session_state.experimental_session.session_data.agent_sequence)):
+        return st.session_state.experimental_session.session_data.agent_sequence[agent_index]
 
     return None
 
@@ -1104,7 +1130,7 @@ def ensure_round_transition_data_integrity(from_round: int, to_round: int):
                 "transition_timestamp": datetime.now().isoformat(),
                 "participant_id": st.session_state.learner_profile.get(
                     "unique_id") if st.session_state.learner_profile else "unknown",
-                "experimental_session_id": st.session_state.experimental_session.session_data["session_id"]
+                "experimental_session_id": st.session_state.experimental_session.session_data.session_id
             }
         )
 
@@ -1152,12 +1178,9 @@ def handle_response(response):
             dict_elements.extend(elements.get("edges", []))
         else:
             dict_elements = [e for e in elements if isinstance(e, dict)]
-        current_nodes = {
-            e["data"]["id"] for e in dict_elements if "source" not in e.get("data", {})
-        }
-        current_edges = {
-            e["data"]["id"] for e in dict_elements if "source" in e.get("data", {})
-        }
+        node_elements, edge_elements = split_elements(dict_elements)
+        current_nodes = {e["data"]["id"] for e in node_elements}
+        current_edges = {e["data"]["id"] for e in edge_elements}
 
         prev_nodes = st.session_state.get("_prev_cm_nodes")
         prev_edges = st.session_state.get("_prev_cm_edges")
@@ -1264,8 +1287,7 @@ def handle_response(response):
             st.success(f"✅ Concept map data captured: {element_count} elements")
 
             # Show element breakdown
-            nodes = [e for e in dict_elements if "source" not in e.get("data", {})]
-            edges = [e for e in dict_elements if "source" in e.get("data", {})]
+            nodes, edges = split_elements(dict_elements)
             st.write(f"**Elements breakdown:** {len(nodes)} nodes, {len(edges)} edges")
 
             # Show first few elements for verification
@@ -12,6 +12,7 @@ import random
 import logging
 import hashlib
 import streamlit as st
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -40,6 +41,14 @@ except ImportError:
     from utils.mermaid_parser import MermaidParser
     from database.mdbservice import *
 
+# orjson is optional; it parses component payloads several times faster and
+# its decode error subclasses json.JSONDecodeError, so callers handle both alike
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # Experimental conditions for balanced assignment
@@ -52,23 +61,50 @@ AGENT_SEQUENCES = {
     'CG_NEUTRAL': ["neutral", "neutral", "neutral", "neutral"]
 }
 
+# Display names for every agent type that can appear in a sequence
+AGENT_DISPLAY_NAMES = {
+    agent_type: agent_type.replace('_', ' ').title()
+    for sequence in AGENT_SEQUENCES.values()
+    for agent_type in sequence
+}
+
+
+@dataclass
+class SessionData:
+    """Top-level record of one experimental session; exported via to_dict()."""
+    session_id: str = field(default_factory=lambda: f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    start_time: str = field(default_factory=lambda: datetime.now().isoformat())
+    learner_profile: Dict[str, Any] = field(default_factory=dict)
+    agent_sequence: List[str] = field(default_factory=list)
+    used_agents: List[str] = field(default_factory=list)
+    rounds: List[Dict[str, Any]] = field(default_factory=list)
+    concept_map_evolution: List[Dict[str, Any]] = field(default_factory=list)
+    current_concept_map: Dict[str, Any] = field(default_factory=lambda: {"concepts": [], "relationships": []})
+    conversation_history: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    mode: Optional[str] = None
+    experimental_condition: Optional[str] = None
+    pre_knowledge_questionnaire: Optional[Dict[str, Any]] = None
+    clt_questionnaire: Optional[Dict[str, Any]] = None
+    post_knowledge_questionnaire: Optional[Dict[str, Any]] = None
+    agent_differentiation: Optional[Dict[str, Any]] = None
+    map_adaptation: Optional[Dict[str, Any]] = None
+    end_time: Optional[str] = None
+    total_duration_seconds: Optional[float] = None
+    total_rounds: Optional[int] = None
+    final_concept_map: Optional[Dict[str, Any]] = None
+    map_summary: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export as a plain dict, leaving out sections that were never recorded."""
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
 
 class StreamlitExperimentalSession:
     """Manages a complete interactive experimental session through Streamlit."""
     
     def __init__(self):
         self.system = None
-        self.session_data = {
-            "session_id": f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "start_time": datetime.now().isoformat(),
-            "learner_profile": {},
-            "agent_sequence": [],
-            "used_agents": [],
-            "rounds": [],
-            "concept_map_evolution": [],
-            "current_concept_map": {"concepts": [], "relationships": []},
-            "mode": None
-        }
+        self.session_data = SessionData()
         self.db_service = None
         self.ai_manager = None
         self.session_logger = None
@@ -77,7 +113,7 @@ class StreamlitExperimentalSession:
     def initialize_system(self, mode: str, participant_id: Optional[str] = None):
         """Initialize the MAS system with the specified mode."""
         try:
-            self.session_data["mode"] = mode
+            self.session_data.mode = mode
             
             # Initialize system
             config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.json")
@@ -131,7 +167,7 @@ class StreamlitExperimentalSession:
 
     def demo_mode_fallback(self):
         st.info("Falling back to demo mode")
-        self.session_data["mode"] = "demo"
+        self.session_data.mode = "demo"
 
             
 
@@ -275,7 +311,7 @@ class StreamlitExperimentalSession:
                                 "question_id": "attention_check_pre",
                                 "selected_answer": attention_check_response.get("selected_answer", "N/A"),
                                 "correct_answer": attention_check_response.get("correct_answer", "B"),
-                                "participant_id": self.session_data.get("learner_profile", {}).get("unique_id", "N/A"),
+                                "participant_id": self.session_data.learner_profile.get("unique_id", "N/A"),
                                 "timestamp": datetime.now().isoformat()
                             }
                         )
@@ -287,7 +323,7 @@ class StreamlitExperimentalSession:
                     st.session_state.show_tutorial = False
 
                     # Persist questionnaire data with explicit failure marker
-                    self.session_data["pre_knowledge_questionnaire"] = {
+                    self.session_data.pre_knowledge_questionnaire = {
                         "responses": responses,
                         "score": score,
                         "total_questions": len(questions),
@@ -323,7 +359,7 @@ class StreamlitExperimentalSession:
                 }
                 
                 # Add to session data
-                self.session_data["pre_knowledge_questionnaire"] = questionnaire_data
+                self.session_data.pre_knowledge_questionnaire = questionnaire_data
                 
                 # Log the questionnaire completion
                 if self.session_logger:
@@ -511,8 +547,8 @@ class StreamlitExperimentalSession:
                 clt_data = {
                     "responses": responses,
                     "construct_scores": construct_scores,
-                    "participant_id": self.session_data.get("learner_profile", {}).get("name", "unknown"),
-                    "unique_id": self.session_data.get("learner_profile", {}).get("unique_id", "N/A"),
+                    "participant_id": self.session_data.learner_profile.get("name", "unknown"),
+                    "unique_id": self.session_data.learner_profile.get("unique_id", "N/A"),
                     "timestamp": datetime.now().isoformat(),
                     "randomized_order": st.session_state.clt_item_order
                 }
@@ -525,7 +561,7 @@ class StreamlitExperimentalSession:
 
                 
                 # Add to session data
-                self.session_data["clt_questionnaire"] = clt_data
+                self.session_data.clt_questionnaire = clt_data
                 
                 # Log the CLT completion with detailed item responses
                 if self.session_logger:
@@ -705,7 +741,7 @@ class StreamlitExperimentalSession:
                                 "question_id": "attention_check_post",
                                 "selected_answer": attention_check_response.get("selected_answer", "N/A"),
                                 "correct_answer": attention_check_response.get("correct_answer", "B"),
-                                "participant_id": self.session_data.get("learner_profile", {}).get("unique_id", "N/A"),
+                                "participant_id": self.session_data.learner_profile.get("unique_id", "N/A"),
                                 "timestamp": datetime.now().isoformat()
                             }
                         )
@@ -721,7 +757,7 @@ class StreamlitExperimentalSession:
                 }
 
                 # Add to session data
-                self.session_data["post_knowledge_questionnaire"] = questionnaire_data
+                self.session_data.post_knowledge_questionnaire = questionnaire_data
 
                 # Log the questionnaire completion
                 if self.session_logger:
@@ -923,7 +959,7 @@ class StreamlitExperimentalSession:
                 }
                 
                 # Store in session data
-                self.session_data["learner_profile"] = profile
+                self.session_data.learner_profile = profile
                 
                 # Log profile creation
                 if self.session_logger:
@@ -987,11 +1023,11 @@ class StreamlitExperimentalSession:
             Assigned experimental condition (EG_SEQ, CG_WRONG_SEQ, or CG_NEUTRAL)
         """
         # Check if condition already assigned
-        if "experimental_condition" in self.session_data:
-            return self.session_data["experimental_condition"]
+        if self.session_data.experimental_condition is not None:
+            return self.session_data.experimental_condition
         
         # Use session ID for deterministic balanced assignment
-        session_id = self.session_data["session_id"]
+        session_id = self.session_data.session_id
         
         # Convert to number and mod by 3 for balanced distribution
         hash_value = int(hashlib.md5(session_id.encode()).hexdigest(), 16)
@@ -1000,7 +1036,7 @@ class StreamlitExperimentalSession:
         assigned_condition = EXPERIMENTAL_CONDITIONS[condition_index]
         
         # Store in session data
-        self.session_data["experimental_condition"] = assigned_condition
+        self.session_data.experimental_condition = assigned_condition
         
         # Log the assignment
         if self.session_logger:
@@ -1041,7 +1077,7 @@ class StreamlitExperimentalSession:
         
         # Note: Round 0 is handled separately (no scaffolding agent)
         
-        self.session_data["agent_sequence"] = agents
+        self.session_data.agent_sequence = agents
         
         # Log the condition-based sequence
         if self.session_logger:
@@ -1050,7 +1086,7 @@ class StreamlitExperimentalSession:
                 metadata={
                     "agent_sequence": agents,
                     "experimental_condition": experimental_condition,
-                    "participant_id": self.session_data["learner_profile"].get("name", "unknown"),
+                    "participant_id": self.session_data.learner_profile.get("name", "unknown"),
                     "sequence_type": "experimental_condition_based",
                     "total_rounds": 5,  # Including round 0
                     "note": f"Round 0 is baseline (no scaffolding), followed by 4 rounds with {experimental_condition} condition"
@@ -1067,9 +1103,9 @@ class StreamlitExperimentalSession:
         
         # Adjust for 0-based indexing after round 0
         agent_index = roundn - 1
-        if agent_index < len(self.session_data["agent_sequence"]):
-            agent_type = self.session_data["agent_sequence"][agent_index]
-            return agent_type.replace('_', ' ').title()
+        if agent_index < len(self.session_data.agent_sequence):
+            agent_type = self.session_data.agent_sequence[agent_index]
+            return AGENT_DISPLAY_NAMES.get(agent_type) or agent_type.replace('_', ' ').title()
         return "Unknown Agent"
     
     def convert_streamlit_to_internal_format(self, streamlit_cm_data) -> Dict[str, Any]:
@@ -1106,7 +1142,7 @@ class StreamlitExperimentalSession:
             # Handle string input (might be JSON or initial map format)
             try:
                 if streamlit_cm_data.strip():
-                    parsed_data = json.loads(streamlit_cm_data)
+                    parsed_data = _json_loads(streamlit_cm_data)
                     if isinstance(parsed_data, dict):
                         streamlit_cm_data = parsed_data
                         logger.info(f"   ✅ Successfully parsed JSON: {len(parsed_data)} keys")
@@ -1240,10 +1276,10 @@ class StreamlitExperimentalSession:
         
         # Adjust for agent sequence after round 0
         agent_index = roundn - 1
-        if agent_index >= len(self.session_data["agent_sequence"]):
+        if agent_index >= len(self.session_data.agent_sequence):
             return "Session completed. Thank you for participating!"
         
-        agent_type = self.session_data["agent_sequence"][agent_index]
+        agent_type = self.session_data.agent_sequence[agent_index]
         
         # Apply pattern detection to ALL agents including neutral agent
         if user_response is not None and agent_type != "neutral":
@@ -1279,7 +1315,7 @@ class StreamlitExperimentalSession:
                                 "conversation_turn": conversation_turn,
                                 "response_type": "pattern_based",
                                 "pattern_detected": response_analysis.get("response_type", "unknown"),
-                                "experimental_condition": self.session_data.get("experimental_condition", "unknown"),
+                                "experimental_condition": self.session_data.experimental_condition or "unknown",
                                 "concept_map_nodes": len(concept_map_data.get("elements", [])) if isinstance(concept_map_data, dict) and concept_map_data else 0
                             }
                         )
@@ -1319,7 +1355,7 @@ class StreamlitExperimentalSession:
                         "round_number": roundn,
                         "conversation_turn": conversation_turn,
                         "response_type": "neutral_direct",
-                        "experimental_condition": self.session_data.get("experimental_condition", "unknown"),
+                        "experimental_condition": self.session_data.experimental_condition or "unknown",
                         "concept_map_nodes": len(internal_format.get("concepts", [])),
                         "concept_map_edges": len(internal_format.get("relationships", []))
                     }
@@ -1336,7 +1372,7 @@ class StreamlitExperimentalSession:
         }
         
         # Try OpenAI integration for experimental mode (only for scaffolding agents)
-        if self.session_data["mode"] == "experimental" and self.ai_manager and agent_type != "neutral":
+        if self.session_data.mode == "experimental" and self.ai_manager and agent_type != "neutral":
             try:
                 # Safely convert concept map data to internal format with robust error handling
                 internal_format = {"concepts": [], "relationships": []}
@@ -1410,9 +1446,9 @@ class StreamlitExperimentalSession:
                     "round_number": roundn,
                     "conversation_turn": conversation_turn,
                     "conversation_history": conversation_history,
-                    "learner_profile": self.session_data.get("learner_profile", {}),
-                    "previous_rounds": len(self.session_data.get("rounds", [])),
-                    "concept_map_evolution": self.session_data.get("concept_map_evolution", [])
+                    "learner_profile": self.session_data.learner_profile,
+                    "previous_rounds": len(self.session_data.rounds),
+                    "concept_map_evolution": self.session_data.concept_map_evolution
                 }
                 
                 # Ensure internal_format is a proper dictionary
@@ -1423,7 +1459,7 @@ class StreamlitExperimentalSession:
                 map_analysis = self.analyze_concept_map_performance(internal_format, roundn)
                 
                 # Get scaffolding level from learner profile
-                scaffolding_level = self.session_data.get("learner_profile", {}).get("scaffolding_level", "medium")
+                scaffolding_level = self.session_data.learner_profile.get("scaffolding_level", "medium")
                 
                 # Generate scaffolding response with level
                 api_result = self.ai_manager.generate_scaffolding_response(
@@ -1455,7 +1491,7 @@ class StreamlitExperimentalSession:
                             "tokens_used": api_result.get("tokens_used") if isinstance(api_result, dict) else 0,
                             "concept_map_nodes": len(internal_format.get("concepts", [])),
                             "concept_map_edges": len(internal_format.get("relationships", [])),
-                            "experimental_condition": self.session_data.get("experimental_condition", "unknown")
+                            "experimental_condition": self.session_data.experimental_condition or "unknown"
                         }
                     )
                 
@@ -1499,7 +1535,7 @@ class StreamlitExperimentalSession:
                     "round_number": roundn,
                     "conversation_turn": conversation_turn,
                     "response_type": "demo",
-                    "experimental_condition": self.session_data.get("experimental_condition", "unknown"),
+                    "experimental_condition": self.session_data.experimental_condition or "unknown",
                     "concept_map_nodes": len(concept_map_data.get("elements", [])) if isinstance(concept_map_data, dict) and concept_map_data else 0
                 }
             )
@@ -1691,7 +1727,7 @@ class StreamlitExperimentalSession:
                 agent_type = None
             else:
                 agent_index = roundn - 1
-                agent_type = self.session_data["agent_sequence"][agent_index] if agent_index < len(self.session_data["agent_sequence"]) else None
+                agent_type = self.session_data.agent_sequence[agent_index] if agent_index < len(self.session_data.agent_sequence) else None
             
             self.session_logger.log_user_input(
                 input_text=user_response,
@@ -1718,7 +1754,7 @@ class StreamlitExperimentalSession:
                 agent_type = None
             else:
                 agent_index = roundn - 1
-                agent_type = self.session_data["agent_sequence"][agent_index] if agent_index < len(self.session_data["agent_sequence"]) else None
+                agent_type = self.session_data.agent_sequence[agent_index] if agent_index < len(self.session_data.agent_sequence) else None
             
             # Add to evolution with enhanced data
             evolution_entry = {
@@ -1731,10 +1767,10 @@ class StreamlitExperimentalSession:
                 "session_timing": session_timing
             }
             
-            self.session_data["concept_map_evolution"].append(evolution_entry)
+            self.session_data.concept_map_evolution.append(evolution_entry)
             
             # Update current concept map (cumulative)
-            self.session_data["current_concept_map"] = internal_format
+            self.session_data.current_concept_map = internal_format
             
             # Log detailed concept map actions if available
             if action_history and self.session_logger:
@@ -1748,7 +1784,7 @@ class StreamlitExperimentalSession:
                         "round_number": roundn,
                         "nodes_count": len(internal_format.get("concepts", [])),
                         "edges_count": len(internal_format.get("relationships", [])),
-                        "evolution_length": len(self.session_data["concept_map_evolution"]),
+                        "evolution_length": len(self.session_data.concept_map_evolution),
                         "input_data_type": type(concept_map_data).__name__,
                         "action_count": len(action_history),
                         "interaction_metrics": interaction_metrics
@@ -1773,7 +1809,7 @@ class StreamlitExperimentalSession:
                 agent_type = None
             else:
                 agent_index = roundn - 1
-                agent_type = self.session_data["agent_sequence"][agent_index] if agent_index < len(self.session_data["agent_sequence"]) else None
+                agent_type = self.session_data.agent_sequence[agent_index] if agent_index < len(self.session_data.agent_sequence) else None
             
             # Create a minimal evolution entry to maintain session continuity
             evolution_entry = {
@@ -1785,7 +1821,7 @@ class StreamlitExperimentalSession:
                 "interaction_metrics": {},
                 "session_timing": {}
             }
-            self.session_data["concept_map_evolution"].append(evolution_entry)
+            self.session_data.concept_map_evolution.append(evolution_entry)
     
     def log_detailed_concept_map_actions(self, roundn: int, action_history: List[Dict], interaction_metrics: Dict):
         """Log detailed concept map actions for research analysis."""
@@ -1800,7 +1836,7 @@ class StreamlitExperimentalSession:
             event_type="detailed_concept_map_actions",
             metadata={
                 "round_number": roundn,
-                "agent_type": self.session_data["agent_sequence"][roundn] if roundn < len(self.session_data["agent_sequence"]) else None,
+                "agent_type": self.session_data.agent_sequence[roundn] if roundn < len(self.session_data.agent_sequence) else None,
                 "total_actions": len(action_history),
                 "action_breakdown": {
                     "nodes_created": interaction_metrics.get("nodes_created", 0),
@@ -1915,25 +1951,25 @@ class StreamlitExperimentalSession:
         """Finalize the session and export data."""
         try:
             # Add final summary to session data
-            self.session_data["end_time"] = datetime.now().isoformat()
-            self.session_data["total_duration_seconds"] = (
-                datetime.fromisoformat(self.session_data["end_time"]) - 
-                datetime.fromisoformat(self.session_data["start_time"])
+            self.session_data.end_time = datetime.now().isoformat()
+            self.session_data.total_duration_seconds = (
+                datetime.fromisoformat(self.session_data.end_time) - 
+                datetime.fromisoformat(self.session_data.start_time)
             ).total_seconds()
-            self.session_data["total_rounds"] = len(self.session_data["rounds"])
-            self.session_data["final_concept_map"] = self.session_data["current_concept_map"]
+            self.session_data.total_rounds = len(self.session_data.rounds)
+            self.session_data.final_concept_map = self.session_data.current_concept_map
             
             # Calculate and add map summary statistics
-            final_nodes = len(self.session_data["current_concept_map"].get("concepts", []))
-            final_edges = len(self.session_data["current_concept_map"].get("relationships", []))
+            final_nodes = len(self.session_data.current_concept_map.get("concepts", []))
+            final_edges = len(self.session_data.current_concept_map.get("relationships", []))
             
             # Add map_summary to session data for easy identification
-            self.session_data["map_summary"] = {
+            self.session_data.map_summary = {
                 "final_nodes": final_nodes,
                 "final_edges": final_edges,
                 "connectivity_ratio": round(final_edges / max(1, final_nodes), 2),
-                "participant_id": self.session_data.get("learner_profile", {}).get("unique_id", "N/A"),
-                "participant_name": self.session_data.get("learner_profile", {}).get("name", "Unknown")
+                "participant_id": self.session_data.learner_profile.get("unique_id", "N/A"),
+                "participant_name": self.session_data.learner_profile.get("name", "Unknown")
             }
             
             # Save session data
@@ -1944,11 +1980,11 @@ class StreamlitExperimentalSession:
                 # Log map summary event for easy identification
                 self.session_logger.log_event(
                     event_type="map_summary",
-                    metadata=self.session_data["map_summary"]
+                    metadata=self.session_data.map_summary
                 )
                 
                 self.session_logger.log_session_end({
-                    "total_rounds": len(self.session_data["rounds"]),
+                    "total_rounds": len(self.session_data.rounds),
                     "final_nodes": final_nodes,
                     "final_edges": final_edges,
                     "export_files": export_info
@@ -1969,7 +2005,7 @@ class StreamlitExperimentalSession:
         """Save complete session data to JSON and CSV files."""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            participant_name = self.session_data['learner_profile'].get('name', 'unknown')
+            participant_name = self.session_data.learner_profile.get('name', 'unknown')
             
             # Create experimental_data directory - use correct path relative to project root
             experimental_data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "experimental_data")
@@ -1980,7 +2016,7 @@ class StreamlitExperimentalSession:
             json_filepath = os.path.join(experimental_data_dir, json_filename)
             
             with open(json_filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.session_data, f, indent=2, ensure_ascii=False)
+                json.dump(self.session_data.to_dict(), f, indent=2, ensure_ascii=False)
             
             # CSV export (flattened for analysis)
             csv_filename = f"experimental_results_{participant_name}_{timestamp}.csv"
@@ -1990,7 +2026,7 @@ class StreamlitExperimentalSession:
 
             # Export session data to the database
             if self.db_service:
-                self.db_service.insert_session(self.session_data)
+                self.db_service.insert_session(self.session_data.to_dict())
 
             return {
                 "json_file": json_filepath,
@@ -2018,7 +2054,7 @@ class StreamlitExperimentalSession:
         
         csv_data = []
         
-        for round_data in self.session_data.get("rounds", []):
+        for round_data in self.session_data.rounds:
             round_num = round_data.get("round_number", 0)
             concept_map = round_data.get("concept_map", {})
             nodes = concept_map.get("concepts", [])
@@ -2026,15 +2062,15 @@ class StreamlitExperimentalSession:
             
             # Create base row data
             base_row = {
-                "participant_name": self.session_data["learner_profile"].get("name", "unknown"),
-                "session_id": self.session_data["session_id"],
+                "participant_name": self.session_data.learner_profile.get("name", "unknown"),
+                "session_id": self.session_data.session_id,
                 "round_number": round_num,
                 "agent_type": round_data.get("agent_type", ""),
-                "agent_sequence": ",".join(self.session_data["agent_sequence"]),
-                "experimental_condition": self.session_data.get("experimental_condition", "unknown"),
+                "agent_sequence": ",".join(self.session_data.agent_sequence),
+                "experimental_condition": self.session_data.experimental_condition or "unknown",
                 "node_count": len(nodes),
                 "edge_count": len(edges),
-                "mode": self.session_data.get("mode", "unknown")
+                "mode": self.session_data.mode or "unknown"
             }
             
             # Add one row per round with summary data
@@ -2050,21 +2086,14 @@ class StreamlitExperimentalSession:
     
     def get_conversation_history(self, roundn: int) -> List[Dict[str, Any]]:
         """Get conversation history for a specific round."""
-        # Initialize conversation history if not exists
-        if "conversation_history" not in self.session_data:
-            self.session_data["conversation_history"] = {}
-        
         round_key = f"round_{roundn}"
-        return self.session_data["conversation_history"].get(round_key, [])
+        return self.session_data.conversation_history.get(round_key, [])
     
     def add_to_conversation_history(self, roundn: int, speaker: str, message: str, metadata: Optional[Dict] = None):
         """Add a message to the conversation history for a specific round."""
-        if "conversation_history" not in self.session_data:
-            self.session_data["conversation_history"] = {}
-        
         round_key = f"round_{roundn}"
-        if round_key not in self.session_data["conversation_history"]:
-            self.session_data["conversation_history"][round_key] = []
+        if round_key not in self.session_data.conversation_history:
+            self.session_data.conversation_history[round_key] = []
         
         # Determine agent type and speaker ID
         if speaker == "agent":
@@ -2075,8 +2104,8 @@ class StreamlitExperimentalSession:
             else:
                 # Get specific agent type for rounds 1-4
                 agent_index = roundn - 1
-                if agent_index < len(self.session_data["agent_sequence"]):
-                    agent_type = self.session_data["agent_sequence"][agent_index]
+                if agent_index < len(self.session_data.agent_sequence):
+                    agent_type = self.session_data.agent_sequence[agent_index]
                     speaker_id = agent_type
                 else:
                     speaker_id = speaker
@@ -2093,7 +2122,7 @@ class StreamlitExperimentalSession:
             "metadata": metadata or {}
         }
         
-        self.session_data["conversation_history"][round_key].append(conversation_entry)
+        self.session_data.conversation_history[round_key].append(conversation_entry)
     
     def get_conversation_turn_count(self, roundn: int) -> int:
         """Get the number of conversation turns for a specific round."""
@@ -2119,8 +2148,8 @@ class StreamlitExperimentalSession:
         
         # Get previous map for comparison
         previous_map = None
-        if roundn > 0 and len(self.session_data["concept_map_evolution"]) > 0:
-            previous_entry = self.session_data["concept_map_evolution"][-1]
+        if roundn > 0 and len(self.session_data.concept_map_evolution) > 0:
+            previous_entry = self.session_data.concept_map_evolution[-1]
             previous_map = previous_entry.get("concept_map", {})
         
         # Load expert map
@@ -2206,7 +2235,7 @@ class StreamlitExperimentalSession:
                     "round_number": roundn,
                     "agent_type": agent_type,
                     "scaffolding_level": scaffolding_level,
-                    "background_knowledge_score": self.session_data.get("learner_profile", {}).get("background_knowledge_score", 0),
+                    "background_knowledge_score": self.session_data.learner_profile.get("background_knowledge_score", 0),
                     "concept_map_performance": {
                         "nodes": map_analysis.get("node_count", 0),
                         "edges": map_analysis.get("edge_count", 0),
@@ -2217,7 +2246,7 @@ class StreamlitExperimentalSession:
                     },
                     "zpd_estimates": map_analysis.get("zpd_estimate", {}),
                     "agent_response": agent_response,
-                    "scaffolding_reasoning": f"Background knowledge score {self.session_data.get('learner_profile', {}).get('background_knowledge_score', 0)} → {scaffolding_level} scaffolding",
+                    "scaffolding_reasoning": f"Background knowledge score {self.session_data.learner_profile.get('background_knowledge_score', 0)} → {scaffolding_level} scaffolding",
                     "performance_indicators": {
                         "map_complexity": map_analysis.get("node_count", 0) + map_analysis.get("edge_count", 0),
                         "organization_quality": map_analysis.get("connectivity_ratio", 0),
@@ -2252,12 +2281,12 @@ class StreamlitExperimentalSession:
     
     def calculate_improvement_from_previous(self, roundn: int) -> Dict[str, Any]:
         """Calculate improvement from previous round."""
-        if roundn == 0 or len(self.session_data["concept_map_evolution"]) < 2:
+        if roundn == 0 or len(self.session_data.concept_map_evolution) < 2:
             return {"node_growth": 0, "edge_growth": 0, "connectivity_change": 0.0}
         
         try:
-            current_map = self.session_data["concept_map_evolution"][-1]["concept_map"]
-            previous_map = self.session_data["concept_map_evolution"][-2]["concept_map"]
+            current_map = self.session_data.concept_map_evolution[-1]["concept_map"]
+            previous_map = self.session_data.concept_map_evolution[-2]["concept_map"]
             
             current_nodes = len(current_map.get("concepts", []))
             current_edges = len(current_map.get("relationships", []))
@@ -2279,11 +2308,11 @@ class StreamlitExperimentalSession:
     def get_session_summary(self) -> Dict[str, Any]:
         """Get session summary for display."""
         return {
-            "participant_name": self.session_data["learner_profile"].get("name", "Unknown"),
-            "total_rounds": len(self.session_data.get("rounds", [])),
-            "agent_sequence": self.session_data.get("agent_sequence", []),
-            "final_concept_map": self.session_data.get("current_concept_map", {}),
-            "mode": self.session_data.get("mode", "unknown"),
-            "start_time": self.session_data.get("start_time"),
-            "end_time": self.session_data.get("end_time")
+            "participant_name": self.session_data.learner_profile.get("name", "Unknown"),
+            "total_rounds": len(self.session_data.rounds),
+            "agent_sequence": self.session_data.agent_sequence,
+            "final_concept_map": self.session_data.current_concept_map,
+            "mode": self.session_data.mode or "unknown",
+            "start_time": self.session_data.start_time,
+            "end_time": self.session_data.end_time
         }
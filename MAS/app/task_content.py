@@ -3,6 +3,8 @@ Task Content for International Market Entry Study
 This module contains all task descriptions, materials, and content for the AMG experiment.
 """
 
+import json
+
 STUDY_TITLE = "International Market Entry of a German Software Start-up"
 
 STUDY_INTRODUCTION = """
@@ -122,3 +124,6 @@ EXPERT_CONCEPT_MAP = {
         {"source": "Target Markets", "target": "Marketing Strategy", "relation": "shapes"}
     ]
 }
+
+# Serialized once at import; decoding yields a fresh copy that callers may mutate
+INITIAL_CONCEPT_MAP_JSON = json.dumps(INITIAL_CONCEPT_MAP, separators=(",", ":"), ensure_ascii=False)
@@ -4,17 +4,44 @@ Renders text as images to prevent copying while maintaining readability.
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import (
+    SCRIPT_RUN_CONTEXT_ATTR_NAME,
+    add_script_run_ctx,
+    get_script_run_ctx,
+)
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 import io
+import logging
+import re
 import base64
-import textwrap
-from typing import Optional, Tuple
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
-@st.cache_data
-def get_protected_task_image(task_text: str, width: int = 800, font_size: int = 28):
-    return text_to_image(task_text, width=width, font_size=font_size)
+_FONT_PATH = Path(__file__).parent / "DejaVuSans.ttf"
+
+@lru_cache(maxsize=None)
+def _get_prerender_pool() -> ThreadPoolExecutor:
+    """Create the background render pool on first use, not at import."""
+    # Pillow releases the GIL while rasterizing and encoding, so renders of
+    # independent texts can overlap
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="text_to_image")
+
+
+@lru_cache(maxsize=None)
+def _get_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font once per (path, size) instead of on every render."""
+    return ImageFont.truetype(font_path, size, layout_engine=ImageFont.Layout.BASIC)
+
+
+def get_protected_task_image(task_text: str, width: int = 800, font_size: int = 28) -> bytes:
+    # text_to_png is cached itself; a second cache here would hold every
+    # task image twice
+    return text_to_png(task_text, width=width, font_size=font_size)
 
 
 def render_static_task(task_text: str, title: str = "Task Description"):
@@ -33,93 +60,221 @@ def text_to_image(
         bg_color: Tuple[int, int, int] = (255, 255, 255),
         text_color: Tuple[int, int, int] = (0, 0, 0),
         font_path: Optional[str] = None,
-        scale: int = 3  # for high-resolution rendering
+        scale: int = 1  # >1 renders a larger bitmap for HiDPI screens
 ) -> Image.Image:
     """
-    Convert text to a high-resolution image using a bundled TrueType font.
+    Convert text to an image using a bundled TrueType font.
+
+    FreeType already anti-aliases at the target size, so the default renders
+    at native resolution. Use text_to_png for display; it caches the result.
     """
-    # scale everything for high-resolution
-    width *= scale
-    font_size *= scale
-    line_height *= scale
-    padding *= scale
+    if scale != 1:
+        width *= scale
+        font_size *= scale
+        line_height *= scale
+        padding *= scale
 
     # Load font
-    font_path = Path(__file__).parent / "DejaVuSans.ttf"
     try:
-        font = ImageFont.truetype(str(font_path), font_size)
+        font = _get_font(str(font_path or _FONT_PATH), font_size)
     except IOError:
         font = ImageFont.load_default()
         st.warning("Could not load custom font, using default font.")
 
     # Wrap text
-    chars_per_line = int(width / (font_size * 0.6))
-    wrapper = textwrap.TextWrapper(width=chars_per_line)
-    lines = []
-    for paragraph in text.split("\n"):
-        if paragraph.strip():
-            lines.extend(wrapper.wrap(paragraph))
-        else:
-            lines.append("")
+    lines = _wrap_lines(text, font, width - 2 * padding)
 
     # Calculate height
     height = (len(lines) * line_height) + 2 * padding
-    img = Image.new("RGB", (width, height), bg_color)
+
+    # Gray-on-gray text (the default black on white) needs one byte per
+    # pixel, not three; this shrinks the raster and the PNG encode input
+    if len(set(bg_color)) == 1 and len(set(text_color)) == 1:
+        img = Image.new("L", (width, height), bg_color[0])
+        text_color = text_color[0]
+    else:
+        img = Image.new("RGB", (width, height), bg_color)
     draw = ImageDraw.Draw(img)
 
-    # Draw text
-    y = padding
-    for line in lines:
-        draw.text((padding, y), line, fill=text_color, font=font)
-        y += line_height
+    # Draw all lines in one call; Pillow advances each line by the height of
+    # "A" plus spacing, so derive spacing from that to keep line_height
+    spacing = line_height - font.getbbox("A")[3]
+    draw.multiline_text(
+        (padding, padding), "\n".join(lines),
+        fill=text_color, font=font, spacing=spacing
+    )
 
     return img
 
 
+# Bounded: the app shows a few fixed texts, but every entry is a full page
+# bitmap and the server process lives across many sessions
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def text_to_png(text: str, width: int = 1000, font_size: int = 26) -> bytes:
+    """
+    Render text with text_to_image and return the encoded PNG.
+
+    st.image takes the bytes as they are, so cached renders are neither
+    redrawn nor re-encoded on reruns.
+    """
+    return _encode_png(text_to_image(text, width=width, font_size=font_size))
+
+
+def _wrap_lines(text: str, font: ImageFont.ImageFont, max_width: int) -> List[str]:
+    """
+    Greedily wrap text into lines that fit max_width pixels.
+
+    Measures the real rendered width of the font, so proportional glyphs fill
+    the line instead of relying on an average character width.
+    """
+    lines = []
+    for paragraph in text.split("\n"):
+        words = paragraph.split()
+        if not words:
+            lines.append("")
+            continue
+        # Keep the paragraph's indentation (nested bullet points)
+        indent = paragraph[:len(paragraph) - len(paragraph.lstrip())]
+        line = ""
+        for word in words:
+            candidate = f"{line} {word}" if line else indent + word
+            if font.getlength(candidate) <= max_width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+            # Break a word wider than a whole line across lines by characters
+            while len(line) > 1 and font.getlength(line) > max_width:
+                cut = 1
+                while cut < len(line) - 1 and font.getlength(line[:cut + 1]) <= max_width:
+                    cut += 1
+                lines.append(line[:cut])
+                line = line[cut:]
+        lines.append(line)
+    return lines
+
+
+# Bold/italic markers and list dashes, matched in a single scan
+_MD_CLEANUP = re.compile(r"\*+|- ")
+
+
+def _md_cleanup_replacement(match: "re.Match[str]") -> str:
+    # Drop emphasis markers, convert list dashes to bullet points
+    return "• " if match.group() == "- " else ""
+
+
+@lru_cache(maxsize=128)
+def _clean_markdown(text: str) -> str:
+    """Strip bold/italic markers and turn list dashes into bullets."""
+    return _MD_CLEANUP.sub(_md_cleanup_replacement, text)
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _markdown_sections(markdown_text: str) -> List[Tuple[str, str]]:
+    """
+    Split markdown into (title, plain text) sections.
+
+    The task texts are module constants, so this runs once per text instead
+    of on every Streamlit rerun.
+    """
+    sections = []
+    for i, section in enumerate(markdown_text.split('###')):
+        if not section.strip():
+            continue
+        if i > 0:
+            # Extract title if it's the first line
+            lines = section.strip().split('\n', 1)
+            title = lines[0].strip()
+            content = lines[1] if len(lines) > 1 else ""
+        else:
+            # Handle content before first ###
+            title = ""
+            content = section
+
+        content = _clean_markdown(content).strip()
+        if title or content:
+            sections.append((title, content))
+    return sections
+
+
 def render_protected_markdown(
     markdown_text: str,
     width: int = 800,  # Increased width
     font_size: int = 28  # Much larger font
 ) -> None:
     """
-    Render markdown-formatted text as protected images.
-    Splits by sections for better rendering.
+    Render markdown-formatted text as a protected image.
+    Sections (###) are laid out one after another, each headed by its
+    title, and drawn as a single image.
     
     Args:
         markdown_text: Markdown formatted text
         width: Image width
         font_size: Font size
     """
-    # Split by major sections (###)
-    sections = markdown_text.split('###')
+    png = _markdown_png(markdown_text, width, font_size)
+    if png is not None:
+        st.image(png, use_container_width=True)
+
+
+def _markdown_png(markdown_text: str, width: int, font_size: int) -> Optional[bytes]:
+    """Draw all sections of markdown_text into one (cached) PNG."""
+    blocks = []
+    for title, content in _markdown_sections(markdown_text):
+        blocks.append("\n".join(part for part in (title, content) if part))
+    if not blocks:
+        return None
+    return text_to_png("\n\n".join(blocks), width=width, font_size=font_size)
+
+
+def prerender_protected_markdown(
+    markdown_texts: Iterable[str],
+    width: int = 800,
+    font_size: int = 28
+) -> None:
+    """
+    Warm the image cache for render_protected_markdown in the background.
+
+    Each text is rendered on a worker thread, so the first time a dialog
+    shows it the image is already cached instead of drawn on the rerun.
     
-    for i, section in enumerate(sections):
-        if section.strip():
-            # Extract title if it's the first line
-            lines = section.strip().split('\n', 1)
-            if i > 0 and len(lines) > 0:  # Skip first empty split
-                title = lines[0].strip()
-                content = lines[1] if len(lines) > 1 else ""
-                
-                # Clean up markdown formatting for display
-                content = content.replace('**', '')  # Remove bold markers
-                content = content.replace('*', '')   # Remove italic markers
-                content = content.replace('- ', '• ')  # Convert to bullet points
-                
-                # Create section image
-                if title:
-                    st.markdown(f"### {title}")
-                if content:
-                    img = text_to_image(content.strip(), width=width, font_size=font_size)
-                    st.image(img, use_container_width=True)
-            elif i == 0 and section.strip():
-                # Handle content before first ###
-                content = section.strip()
-                content = content.replace('**', '')
-                content = content.replace('*', '')
-                content = content.replace('- ', '• ')
-                img = text_to_image(content, width=width, font_size=font_size)
-                st.image(img, use_container_width=True)
+    Args:
+        markdown_texts: Markdown formatted texts to render
+        width: Image width, as later passed to render_protected_markdown
+        font_size: Font size, as later passed to render_protected_markdown
+    """
+    ctx = get_script_run_ctx()
+    pool = _get_prerender_pool()
+    for markdown_text in markdown_texts:
+        future = pool.submit(_prerender_markdown_png, ctx, markdown_text, width, font_size)
+        future.add_done_callback(_log_prerender_failure)
+
+
+def _prerender_markdown_png(ctx, markdown_text: str, width: int, font_size: int) -> Optional[bytes]:
+    """Run _markdown_png on a pool thread under the submitting session's context."""
+    # st.cache_data and st.warning look up the script run context of the
+    # current thread; pool threads are shared, so attach it for every task
+    # and detach it again so the session is not kept alive by an idle thread
+    thread = threading.current_thread()
+    add_script_run_ctx(thread, ctx)
+    try:
+        return _markdown_png(markdown_text, width, font_size)
+    finally:
+        # add_script_run_ctx(thread, None) would fall back to the thread's
+        # current context, so clear the attribute directly
+        setattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+
+
+def _log_prerender_failure(future: Future) -> None:
+    """Log a failed background render instead of dropping the exception."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Background render of protected text failed", exc_info=exc)
 
 
 def create_protected_expander(
@@ -139,9 +294,10 @@ def create_protected_expander(
     """
     with st.expander(label):
         # Clean up content
-        clean_content = content.replace('**', '').replace('*', '').replace('- ', '• ')
-        img = text_to_image(clean_content.strip(), width=width, font_size=font_size)
-        st.image(img, use_container_width=True)
+        clean_content = _clean_markdown(content).strip()
+        if clean_content:
+            png = text_to_png(clean_content, width=width, font_size=font_size)
+            st.image(png, use_container_width=True)
         st.caption("📝 This content is protected and cannot be copied.")
 
 
@@ -155,69 +311,14 @@ def encode_image_base64(img: Image.Image) -> str:
     Returns:
         Base64 encoded string
     """
-    buffered = io.BytesIO()
-    img.save(buffered, format="PNG")
-    img_str = base64.b64encode(buffered.getvalue()).decode()
+    img_str = base64.b64encode(_encode_png(img)).decode()
     return img_str
 
 
-def render_protected_html(
-    text: str,
-    width: int = 800,  # Increased width
-    font_size: int = 28  # Much larger font
-) -> None:
-    """
-    Render text as protected HTML with additional JavaScript protection.
-    
-    Args:
-        text: Text to protect
-        width: Image width
-        font_size: Font size
-    """
-    # Create image
-    img = text_to_image(text, width=width, font_size=font_size)
-    img_base64 = encode_image_base64(img)
-    
-    # Create protected HTML (using triple quotes to avoid f-string issues with JavaScript)
-    protected_html = f"""
-    <div class="protected-content" style="position: relative;">
-        <img src="data:image/png;base64,{img_base64}" 
-             style="width: 100%; user-select: none; -webkit-user-select: none; -moz-user-select: none; -ms-user-select: none;"
-             draggable="false"
-             oncontextmenu="return false;"
-             onselectstart="return false;"
-             onmousedown="return false;">
-        <div style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; z-index: 1000; background: transparent;"
-             oncontextmenu="return false;"
-             onselectstart="return false;"
-             onmousedown="return false;">
-        </div>
-    </div>
-    <script>
-    document.addEventListener('DOMContentLoaded', function() {{
-        document.querySelectorAll('.protected-content').forEach(function(elem) {{
-            elem.addEventListener('contextmenu', function(e) {{
-                e.preventDefault();
-                return false;
-            }});
-            elem.addEventListener('selectstart', function(e) {{
-                e.preventDefault();
-                return false;
-            }});
-            elem.addEventListener('dragstart', function(e) {{
-                e.preventDefault();
-                return false;
-            }});
-        }});
-        
-        document.addEventListener('keydown', function(e) {{
-            if ((e.ctrlKey || e.metaKey) && (e.keyCode == 65 || e.keyCode == 67 || e.keyCode == 88)) {{
-                e.preventDefault();
-                return false;
-            }}
-        }});
-    }});
-    </script>
-    """
-    
-    st.markdown(protected_html, unsafe_allow_html=True)
+def _encode_png(img: Image.Image) -> bytes:
+    """Encode a PIL Image as PNG bytes."""
+    buffered = io.BytesIO()
+    # Black-on-white text compresses well even at the fastest zlib level
+    img.save(buffered, format="PNG", compress_level=1)
+    return buffered.getvalue()
+
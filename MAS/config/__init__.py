@@ -7,15 +7,19 @@ This module contains configuration files and settings for the multi-agent scaffo
 from .scaffolding_config import (
     DEFAULT_SCAFFOLDING_CONFIG,
     SCAFFOLDING_PROMPT_TEMPLATES,
+    SCAFFOLDING_PROMPTS_BY_LEVEL,
     SCAFFOLDING_FOLLOWUP_TEMPLATES,
     SCAFFOLDING_CONCLUSION_TEMPLATES,
-    DEFAULT_SCAFFOLDING_INTENSITY
+    DEFAULT_SCAFFOLDING_INTENSITY,
+    DEFAULT_INTENSITY
 )
 
 __all__ = [
     'DEFAULT_SCAFFOLDING_CONFIG',
     'SCAFFOLDING_PROMPT_TEMPLATES',
+    'SCAFFOLDING_PROMPTS_BY_LEVEL',
     'SCAFFOLDING_FOLLOWUP_TEMPLATES',
     'SCAFFOLDING_CONCLUSION_TEMPLATES',
-    'DEFAULT_SCAFFOLDING_INTENSITY'
+    'DEFAULT_SCAFFOLDING_INTENSITY',
+    'DEFAULT_INTENSITY'
 ]
@@ -7,12 +7,15 @@ Scaffolding Configuratio
     Metacognitive → Focus on self-assessment, regulation, learning process on a meta-level: how can I improve this further? 
     
 This module provides configuration for scaffolding, including prompt templates.
+All tables are read-only mappings, so callers can share them without copying.
 """
 
+from types import MappingProxyType
+
 # Scaffolding prompt templates for different scaffolding types and intensities
-SCAFFOLDING_PROMPT_TEMPLATES = {
-    "strategic": {
-        "high": [
+SCAFFOLDING_PROMPT_TEMPLATES = MappingProxyType({
+    "strategic": MappingProxyType({
+        "high": (
             "I notice that {observation}. What was your overall strategy to solve the challenges that AMG imposes?",
             "Looking at your concept map, I see that {observation}. What approach do you use to solve the barriers imposed by AMG?",
             "Your map has {node_count} concepts and {edge_count} relationships. What might be a logical next step in expanding this area?",
@@ -31,17 +34,17 @@ SCAFFOLDING_PROMPT_TEMPLATES = {
             "What's your strategy for identifying the most critical relationships first? How do you prioritize connection-building?",
             "If you were to add one more important concept to your map that would help connect several existing concepts, what would it be and why?",
             "What additional concepts might be related to {concept} that aren't in your map yet?"
-        ],
-        "medium": [
+        ),
+        "medium": (
             "I see that {observation}. What was your approach to organizing the concepts in your map?",
             "Looking at your concept map, what strategy did you use to decide which concepts to include?",
             "How did you decide which relationships to show between concepts in your map?",
             "What might be your next step in developing this concept map further?",
             "Have you considered alternative ways to organize these concepts? What might work better?"
-        ]
-    },
-    "metacognitive": {
-        "high": [
+        )
+    }),
+    "metacognitive": MappingProxyType({
+        "high": (
             # alt
             "As you look at your concept map now, which parts do you feel most confident about, and which parts are you less certain about?",
             "How has your understanding of {concept} changed since you started working on this concept map? What specific insights have you gained?",
@@ -61,17 +64,17 @@ SCAFFOLDING_PROMPT_TEMPLATES = {
             # SELBSTEVALUATION & ZIELSETZUNG
             "What criteria are you using to judge the quality of the concept map? How does it differ from the beginning?",
             "How do you monitor whether you're integrating new insights effectively into your existing understanding?"
-        ],
-        "medium": [
+        ),
+        "medium": (
             "Which part of your concept map do you feel most confident about? Which part are you least confident about?",
             "How has your understanding of this topic changed as you've worked on this concept map?",
             "What was challenging about creating this concept map?",
             "What do you think is the most important relationship shown in your map? Why?",
             "What questions do you still have about this topic?"
-        ]
-    },
-    "procedural": {
-        "high": [
+        )
+    }),
+    "procedural": MappingProxyType({
+        "high": (
             # KONKRETE ARBEITSSCHRITTE & METHODEN
             "I notice that {observation}. Let me walk you through a systematic method for adding complex relationships: First identify the concepts, then determine the relationship type, then create the linking phrase.",
             "When creating relationships between concepts, follow this procedure: 1) Select your starting concept, 2) Brainstorm all possible connections, 3) Evaluate each connection's validity, 4) Create precise linking phrases. Which concept do you find challenging?",
@@ -87,17 +90,17 @@ SCAFFOLDING_PROMPT_TEMPLATES = {
             "What procedure do you follow to make sure each key factor is represented in your map?",
             "Have you tried grouping your concepts by categories (e.g., financial resources, environment, strategies)?",
             "When you revise your map, what steps do you take to check whether AMG is fully integrated?",
-        ],
-        "medium": [
+        ),
+        "medium": (
             "I see that {observation}. Would you like some tips on how to add or label relationships between concepts?",
             "What process do you follow when creating your concept map?",
             "Have you tried reviewing your map systematically to identify missing connections?",
             "Are there any specific features of your concept mapping tool that you find challenging to use?",
             "How do you decide what type of relationship exists between two concepts?"
-        ]
-    },
-    "conceptual": {
-        "high": [
+        )
+    }),
+    "conceptual": MappingProxyType({
+        "high": (
             # FACHINHALT & THEORETISCHES VERSTÄNDNIS
             "I notice that {observation}. The connection between '{concept}' and market entry barriers might relate to AMG's mechanism of resource blocking. How does this framework help explain what you're seeing?",
             "Your map shows {concept} but doesn't capture all underlying principles that AMG operates through dynamic adaptation yet. How might this core concept influence the relationships you've mapped?",
@@ -119,8 +122,8 @@ SCAFFOLDING_PROMPT_TEMPLATES = {
             "What role does {concept} play in shaping international market entry under AMG?",
             "If you had to explain {concept} to someone new, what would be the three most important aspects to mention?",
             "What’s the link between {concept} and the success factors of international expansion?"
-        ],
-        "medium": [
+        ),
+        "medium": (
             "I see that {observation}. How might the concepts '{concept}' and [another concept] relate to each other?",
             "Can you explain your thinking behind the relationship between these two concepts?",
             "Are there any underlying principles that connect multiple concepts in your map?",
@@ -130,13 +133,21 @@ SCAFFOLDING_PROMPT_TEMPLATES = {
             "Can you explain the difference between {concept} and one of the entry strategies?",
             "What underlying principle explains the relationship between {concept} and {another_concept}?",
             "How would you summarize the importance of {concept} for internationalization?"
-        ]
-    }
-}
+        )
+    })
+})
+
+# Prompt templates keyed by (scaffolding type, intensity), so selection is a
+# single lookup instead of two nested .get() calls
+SCAFFOLDING_PROMPTS_BY_LEVEL = MappingProxyType({
+    (scaffolding_type, intensity): tuple(templates)
+    for scaffolding_type, by_intensity in SCAFFOLDING_PROMPT_TEMPLATES.items()
+    for intensity, templates in by_intensity.items()
+})
 
 # Scaffolding follow-up templates for different scaffolding types
-SCAFFOLDING_FOLLOWUP_TEMPLATES = {
-    "strategic": [
+SCAFFOLDING_FOLLOWUP_TEMPLATES = MappingProxyType({
+    "strategic": (
         # STRATEGY REFINEMENT & ALTERNATIVE APPROACHES
         "Have you considered how this approach might work for tackling other complex areas in your map?",
         "Based on your approach, what alternative strategy might give you even better results here?",
@@ -153,8 +164,8 @@ SCAFFOLDING_FOLLOWUP_TEMPLATES = {
         "That's a logical approach. How did you decide this strategy would be more effective than alternative methods?",
         "Interesting strategic choice. What trade-offs are you making with this approach, and are you comfortable with them?",
         "Given competing priorities, how are you strategically deciding what to focus on first?"
-    ],
-    "metacognitive": [
+    ),
+    "metacognitive": (
         # SELF-MONITORING & CONFIDENCE ASSESSMENT
         "That's a thoughtful self-assessment. What internal signals are you using to gauge whether your understanding is solid or needs more work?",
         "Interesting reflection. How are you monitoring your comprehension as you build these complex relationships?",
@@ -172,8 +183,8 @@ SCAFFOLDING_FOLLOWUP_TEMPLATES = {
         "That's honest self-evaluation. What criteria are you using to measure whether you're meeting your own learning standards?",
         "Given your reflection on progress, how do you decide when you're ready to move to more advanced relationships?",
         "That's good self-awareness. How do you balance pushing yourself versus recognizing when you need to consolidate your current understanding?"
-    ],
-    "procedural": [
+    ),
+    "procedural": (
         # SPECIFIC TECHNIQUES & METHODS
         "That makes sense. Let me walk you through a systematic technique for expanding that area - would that be helpful?",
         "Good point. There's a specific method for checking relationship completeness systematically. Want to try that approach?",
@@ -191,8 +202,8 @@ SCAFFOLDING_FOLLOWUP_TEMPLATES = {
         "That's valuable input. Let's create a standard operating procedure for your concept map reviews - what steps should we include?",
         "Given that challenge, would a specific routine for adding and checking connections help streamline your process?",
         "I understand. There's a particular sequence that makes relationship-building more efficient. Want to try that method?"
-    ],
-    "conceptual": [
+    ),
+    "conceptual": (
         # THEORETICAL UNDERSTANDING & PRINCIPLES
         "That's an insightful connection. How does this relationship fit with the core theoretical framework of internationalization theory?",
         "Interesting insight. What underlying business principle do you think explains why these concepts connect this way?",
@@ -211,70 +222,73 @@ SCAFFOLDING_FOLLOWUP_TEMPLATES = {
         "That's insightful. How does mastering this concept enhance your overall understanding of the AMG challenge?",
         "Good conceptual analysis. What makes this particular relationship between concepts so crucial for practical application?",
         "That's thoughtful interpretation. How does this conceptual understanding illuminate the broader patterns in your map?"
-    ]
-}
+    )
+})
 
 # Scaffolding conclusion templates for different scaffolding types
-SCAFFOLDING_CONCLUSION_TEMPLATES = {
-    "strategic": [
+SCAFFOLDING_CONCLUSION_TEMPLATES = MappingProxyType({
+    "strategic": (
         "Thank you for sharing your strategic approach to concept mapping. Consider how organizing concepts by {specific_approach} might help clarify the relationships in your next revision.",
         "Your strategy for concept mapping reveals thoughtful planning. As you revise, consider how grouping related concepts might make the process even clearer.",
         "Based on our discussion, focusing on the hierarchical relationships between concepts could strengthen your map's organization in your next revision."
-    ],
-    "metacognitive": [
+    ),
+    "metacognitive": (
         "Your reflections show deep engagement with this topic. As you continue, regularly assessing your understanding of key relationships will help identify areas for growth.",
         "This self-assessment of your understanding is valuable. Continue to question which parts feel most solid and which need more exploration as you revise.",
         "Your awareness of your learning process is impressive. Keep tracking how your understanding evolves as you develop your concept map further."
-    ],
-    "procedural": [
+    ),
+    "procedural": (
         "Thank you for discussing your concept mapping process. Try the systematic review approach we discussed to identify additional connections in your next revision.",
         "The step-by-step approach we discussed should help make your concept mapping process more effective. Remember to save your work regularly as you implement these techniques.",
         "As you apply these procedural techniques to your next revision, focus particularly on clearly labeling the relationships between concepts."
-    ],
-    "conceptual": [
+    ),
+    "conceptual": (
         "Your understanding of the relationships between concepts shows depth. In your next revision, consider exploring the connection between {concept_1} and {concept_2} further.",
         "The conceptual links you've identified are meaningful. Consider adding some of the underlying mechanisms we discussed to show deeper relationships in your next map.",
         "Your grasp of how these concepts interconnect is developing well. As you revise, focus on showing how {key_concept} influences multiple other concepts in your map."
-    ]
-}
+    )
+})
 
 # Scaffolding selection weights for different factors
-SCAFFOLDING_SELECTION_WEIGHTS = {
+SCAFFOLDING_SELECTION_WEIGHTS = MappingProxyType({
     "zpd_estimate": 3.0,
     "map_analysis": 2.0,
     "map_comparison": 1.5,
     "round_number": 1.0,
     "interaction_history": 2.0
-}
+})
+
+# Default scaffolding intensity; currently the same for every type
+DEFAULT_INTENSITY = "medium"
 
 # Default scaffolding intensity for each scaffolding type
-DEFAULT_SCAFFOLDING_INTENSITY = {
-    "strategic": "medium",
-    "metacognitive": "medium",
-    "procedural": "medium",
-    "conceptual": "medium"
-}
+DEFAULT_SCAFFOLDING_INTENSITY = MappingProxyType({
+    "strategic": DEFAULT_INTENSITY,
+    "metacognitive": DEFAULT_INTENSITY,
+    "procedural": DEFAULT_INTENSITY,
+    "conceptual": DEFAULT_INTENSITY
+})
 
 # Scaffolding intensity adaptation thresholds
-INTENSITY_ADAPTATION_THRESHOLDS = {
+INTENSITY_ADAPTATION_THRESHOLDS = MappingProxyType({
     "understanding_indicators": 3,  # Number of understanding indicators to decrease intensity
     "confusion_indicators": 2,      # Number of confusion indicators to increase intensity
     "question_count": 2,            # Number of questions to increase intensity
     "response_length": 100          # Minimum response length to consider for adaptation
-}
+})
 
 # Default scaffolding configuration
-DEFAULT_SCAFFOLDING_CONFIG = {
+DEFAULT_SCAFFOLDING_CONFIG = MappingProxyType({
     "prompt_templates": SCAFFOLDING_PROMPT_TEMPLATES,
     "followup_templates": SCAFFOLDING_FOLLOWUP_TEMPLATES,
     "conclusion_templates": SCAFFOLDING_CONCLUSION_TEMPLATES,
     "selection_weights": SCAFFOLDING_SELECTION_WEIGHTS,
     "default_intensity": DEFAULT_SCAFFOLDING_INTENSITY,
     "intensity_thresholds": INTENSITY_ADAPTATION_THRESHOLDS,
-    "scaffolding_types": ["strategic", "metacognitive", "procedural", "conceptual"],
-    "intensity_levels": ["low", "medium", "high"],
+    "scaffolding_types": ("strategic", "metacognitive", "procedural", "conceptual"),
+    "intensity_levels": ("low", "medium", "high"),
     "max_prompts_per_interaction": 3,
     "require_response": True,
     "enable_follow_ups": True,
     "enable_conclusions": True
-}
+})
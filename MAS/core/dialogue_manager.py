@@ -7,10 +7,36 @@ It handles the interactive dialogue with the learner.
 
 import logging
 import random
+import re
+from collections import deque
 from typing import Dict, List, Any, Optional, Callable
 
 logger = logging.getLogger(__name__)
 
+# Indicator phrases, compiled once so each response is scanned in a single
+# case-insensitive pass per category without building a lowercase copy.
+_UNDERSTANDING_INDICATORS = (
+    "understand", "clear", "makes sense", "i see", "i get it", "got it"
+)
+_CONFUSION_INDICATORS = (
+    "confused", "don't understand", "unclear", "not sure", "difficult", "hard to"
+)
+_UNDERSTANDING_RE = re.compile(
+    "|".join(map(re.escape, _UNDERSTANDING_INDICATORS)), re.IGNORECASE
+)
+_CONFUSION_RE = re.compile(
+    "|".join(map(re.escape, _CONFUSION_INDICATORS)), re.IGNORECASE
+)
+
+# Emoji prefix shown in front of prompts and conclusions, by scaffolding type
+_SCAFFOLDING_PREFIXES = {
+    "strategic": "🧭 ",  # Compass
+    "metacognitive": "🧠 ",  # Brain
+    "procedural": "🛠️ ",  # Tools
+    "conceptual": "💡 "   # Light bulb
+}
+_DEFAULT_PREFIX = "🤖 "
+
 class DialogueManager:
     """
     Dialogue manager for the multi-agent scaffolding system.
@@ -32,11 +58,12 @@ class DialogueManager:
             output_handler: Function for handling system output (optional)
         """
         self.config = config
-        self.input_handler = input_handler or self._default_input_handler
-        self.output_handler = output_handler or self._default_output_handler
+        # Fall back to the console built-ins directly
+        self.input_handler = input_handler if input_handler is not None else input
+        self.output_handler = output_handler if output_handler is not None else print
         
-        # Initialize dialogue history
-        self.dialogue_history = []
+        # Initialize dialogue history, optionally capped for long-running sessions
+        self.dialogue_history = deque(maxlen=config.get("dialogue_history_limit"))
         
         logger.info("Initialized dialogue manager")
     
@@ -55,17 +82,30 @@ class DialogueManager:
         Returns:
             List of learner responses
         """
-        logger.info(f"Presenting {scaffolding_type} scaffolding prompts")
+        logger.info("Presenting %s scaffolding prompts", scaffolding_type)
         
         responses = []
+        formatted_prompts = [self._format_prompt(scaffolding_type, prompt) for prompt in prompts]
+        
+        if not require_response:
+            # Nothing to wait for, so present all prompts in one write
+            if formatted_prompts:
+                self.output_handler("\n\n".join(formatted_prompts))
+            self.dialogue_history.extend(
+                {
+                    "type": "prompt",
+                    "scaffolding_type": scaffolding_type,
+                    "prompt": prompt,
+                    "formatted_prompt": formatted_prompt
+                }
+                for prompt, formatted_prompt in zip(prompts, formatted_prompts)
+            )
+            return responses
         
         # Present each prompt and collect response
-        for i, prompt in enumerate(prompts):
-            # Format prompt with scaffolding type
-            formatted_prompt = self._format_prompt(scaffolding_type, prompt)
-            
-            # Present prompt
-            self.output_handler(formatted_prompt)
+        for i, (prompt, formatted_prompt) in enumerate(zip(prompts, formatted_prompts)):
+            # Present prompt, separated from the previous exchange
+            self.output_handler("\n" + formatted_prompt if i else formatted_prompt)
             
             # Record prompt in dialogue history
             self.dialogue_history.append({
@@ -75,23 +115,17 @@ class DialogueManager:
                 "formatted_prompt": formatted_prompt
             })
             
-            # Collect response if required
-            if require_response:
-                response_prompt = "Your response: "
-                response = self.input_handler(response_prompt)
-                
-                # Record response in dialogue history
-                self.dialogue_history.append({
-                    "type": "response",
-                    "scaffolding_type": scaffolding_type,
-                    "response": response
-                })
-                
-                responses.append(response)
+            response_prompt = "Your response: "
+            response = self.input_handler(response_prompt)
             
-            # Add a separator between prompts
-            if i < len(prompts) - 1:
-                self.output_handler("\n")
+            # Record response in dialogue history
+            self.dialogue_history.append({
+                "type": "response",
+                "scaffolding_type": scaffolding_type,
+                "response": response
+            })
+            
+            responses.append(response)
         
         return responses
     
@@ -110,7 +144,7 @@ class DialogueManager:
         Returns:
             Learner response, or None if no response is required
         """
-        logger.info(f"Presenting {scaffolding_type} follow-up prompt")
+        logger.info("Presenting %s follow-up prompt", scaffolding_type)
         
         # Format follow-up prompt
         formatted_follow_up = self._format_prompt(scaffolding_type, follow_up)
@@ -152,7 +186,7 @@ class DialogueManager:
             scaffolding_type: Type of scaffolding
             conclusion: Conclusion text
         """
-        logger.info(f"Presenting {scaffolding_type} conclusion")
+        logger.info("Presenting %s conclusion", scaffolding_type)
         
         # Format conclusion
         formatted_conclusion = self._format_conclusion(scaffolding_type, conclusion)
@@ -183,28 +217,16 @@ class DialogueManager:
         # Calculate response length
         response_length = len(response)
         
-        # Check for indicators of understanding
-        understanding_indicators = [
-            "understand", "clear", "makes sense", "I see", "I get it", "got it"
-        ]
-        
-        understanding_count = 0
-        for indicator in understanding_indicators:
-            if indicator.lower() in response.lower():
-                understanding_count += 1
-        
-        # Check for indicators of confusion
-        confusion_indicators = [
-            "confused", "don't understand", "unclear", "not sure", "difficult", "hard to"
-        ]
-        
-        confusion_count = 0
-        for indicator in confusion_indicators:
-            if indicator.lower() in response.lower():
-                confusion_count += 1
-        
-        # Check for questions
-        question_count = response.count("?")
+        if not response or response.isspace():
+            # Blank responses have no indicators or questions to scan for
+            understanding_count = confusion_count = question_count = 0
+        else:
+            # Count each distinct indicator once, as a presence check
+            understanding_count = len({m.lower() for m in _UNDERSTANDING_RE.findall(response)})
+            confusion_count = len({m.lower() for m in _CONFUSION_RE.findall(response)})
+            
+            # Check for questions
+            question_count = response.count("?")
         
         # Determine response sentiment
         if understanding_count > confusion_count:
@@ -239,7 +261,7 @@ class DialogueManager:
         Returns:
             The dialogue history
         """
-        return self.dialogue_history
+        return list(self.dialogue_history)
     
     def _format_prompt(self, scaffolding_type: str, prompt: str) -> str:
         """
@@ -252,11 +274,7 @@ class DialogueManager:
         Returns:
             Formatted prompt
         """
-        # Get emoji for scaffolding type
-        emoji = self._get_scaffolding_emoji(scaffolding_type)
-        
-        # Format prompt
-        return f"{emoji} {prompt}"
+        return _SCAFFOLDING_PREFIXES.get(scaffolding_type, _DEFAULT_PREFIX) + prompt
     
     def _format_conclusion(self, scaffolding_type: str, conclusion: str) -> str:
         """
@@ -269,48 +287,4 @@ class DialogueManager:
         Returns:
             Formatted conclusion
         """
-        # Get emoji for scaffolding type
-        emoji = self._get_scaffolding_emoji(scaffolding_type)
-        
-        # Format conclusion
-        return f"{emoji} {conclusion}"
-    
-    def _get_scaffolding_emoji(self, scaffolding_type: str) -> str:
-        """
-        Get the emoji for a scaffolding type.
-        
-        Args:
-            scaffolding_type: Type of scaffolding
-            
-        Returns:
-            Emoji for the scaffolding type
-        """
-        emojis = {
-            "strategic": "🧭",  # Compass
-            "metacognitive": "🧠",  # Brain
-            "procedural": "🛠️",  # Tools
-            "conceptual": "💡"   # Light bulb
-        }
-        
-        return emojis.get(scaffolding_type, "🤖")
-    
-    def _default_input_handler(self, prompt: str) -> str:
-        """
-        Default input handler.
-        
-        Args:
-            prompt: Input prompt
-            
-        Returns:
-            User input
-        """
-        return input(prompt)
-    
-    def _default_output_handler(self, text: str) -> None:
-        """
-        Default output handler.
-        
-        Args:
-            text: Output text
-        """
-        print(text)
+        return _SCAFFOLDING_PREFIXES.get(scaffolding_type, _DEFAULT_PREFIX) + conclusion
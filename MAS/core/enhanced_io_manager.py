@@ -14,9 +14,77 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime
 import asyncio
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+
+def _keyword_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    """
+    Compile lowercase keywords into one pattern that reports every keyword
+    occurrence, including ones overlapping another match.
+    """
+    return re.compile("(?=(%s))" % "|".join(map(re.escape, keywords)))
+
+
+def _count_keywords(pattern: re.Pattern, lower_text: str) -> int:
+    """Count how many distinct keywords of a pattern occur in lowercase text."""
+    return len(set(pattern.findall(lower_text)))
+
+
+# Bounds for InteractionAnalyzer's per-response feature cache
+_ANALYSIS_CACHE_SIZE = 256
+_MAX_CACHED_RESPONSE_LENGTH = 4096
+
+# Keyword groups used by InteractionAnalyzer, compiled once at import
+_UNCERTAINTY_RE = _keyword_pattern((
+    "maybe", "perhaps", "might", "could", "possibly",
+    "not sure", "don't know", "uncertain", "unclear"
+))
+_CONFIDENCE_RE = _keyword_pattern((
+    "definitely", "certainly", "sure", "confident",
+    "clear", "obvious", "understand", "know"
+))
+_METACOGNITIVE_RE = _keyword_pattern((
+    "think", "believe", "feel", "realize", "understand",
+    "learned", "discovered", "noticed", "remember"
+))
+_ELABORATION_RE = _keyword_pattern((
+    "because", "since", "therefore", "however", "although",
+    "for example", "such as", "specifically", "in particular"
+))
+_DEEP_PROCESSING_RE = _keyword_pattern((
+    "analyze", "compare", "evaluate", "synthesize", "relate",
+    "connect", "integrate", "apply", "transfer"
+))
+_SURFACE_PROCESSING_RE = _keyword_pattern((
+    "memorize", "repeat", "list", "recall", "remember"
+))
+_CONCEPTUAL_RE = _keyword_pattern((
+    "relationship", "connection", "pattern", "principle",
+    "concept", "idea", "theory", "model"
+))
+_PROGRESS_RE = _keyword_pattern((
+    "learned", "understand", "realize", "see", "get it",
+    "makes sense", "clear", "aha", "insight"
+))
+_CONFUSION_RE = _keyword_pattern((
+    "confused", "unclear", "don't understand", "lost",
+    "difficult", "hard", "complicated"
+))
+_CONSTRUCTION_RE = _keyword_pattern((
+    "connect", "relate", "link", "combine", "integrate",
+    "build", "develop", "create"
+))
+_POSITIVE_RE = _keyword_pattern((
+    "good", "great", "excellent", "like", "enjoy", "interesting",
+    "helpful", "useful", "clear", "understand"
+))
+_NEGATIVE_RE = _keyword_pattern((
+    "bad", "difficult", "hard", "confusing", "unclear", "frustrated",
+    "don't like", "boring", "useless"
+))
+
 class InputHandler(ABC):
     """Abstract base class for input handlers."""
     
@@ -47,7 +115,8 @@ class InteractionAnalyzer:
     """Analyzes user interactions for experimental and scaffolding purposes."""
     
     def __init__(self):
-        self.analysis_cache = {}
+        # LRU cache of response features; short replies like "ok" repeat often
+        self.analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
     def analyze_response(self, response: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -63,17 +132,47 @@ class InteractionAnalyzer:
         analysis = {
             "timestamp": datetime.now().isoformat(),
             "response_text": response,
-            "context": context,
-            "metrics": self._calculate_response_metrics(response),
-            "linguistic_features": self._analyze_linguistic_features(response),
-            "cognitive_indicators": self._analyze_cognitive_indicators(response, context),
-            "engagement_level": self._assess_engagement_level(response),
-            "scaffolding_needs": self._assess_scaffolding_needs(response, context),
-            "learning_indicators": self._identify_learning_indicators(response)
+            "context": context
         }
         
+        # Copy the cached feature dicts so callers can annotate them freely
+        for key, value in self._get_response_features(response).items():
+            analysis[key] = dict(value) if isinstance(value, dict) else value
+        
         return analysis
     
+    def _get_response_features(self, response: str) -> Dict[str, Any]:
+        """
+        Get the text-derived analysis features, reusing cached results.
+        
+        The feature helpers take only the response text (never the context),
+        so the cache is keyed by the response alone.
+        """
+        features = self.analysis_cache.get(response)
+        if features is not None:
+            self.analysis_cache.move_to_end(response)
+            return features
+        
+        # Tokenize and lowercase once, then share them across the helpers
+        lower_response = response.lower()
+        metrics = self._calculate_response_metrics(response)
+        
+        features = {
+            "metrics": metrics,
+            "linguistic_features": self._analyze_linguistic_features(lower_response),
+            "cognitive_indicators": self._analyze_cognitive_indicators(lower_response, metrics),
+            "engagement_level": self._assess_engagement_level(lower_response, metrics),
+            "scaffolding_needs": self._assess_scaffolding_needs(lower_response),
+            "learning_indicators": self._identify_learning_indicators(lower_response)
+        }
+        
+        if len(response) <= _MAX_CACHED_RESPONSE_LENGTH:
+            self.analysis_cache[response] = features
+            if len(self.analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                self.analysis_cache.popitem(last=False)
+        
+        return features
+    
     def _calculate_response_metrics(self, response: str) -> Dict[str, Any]:
         """Calculate basic response metrics."""
         words = response.split()
@@ -89,87 +188,64 @@ class InteractionAnalyzer:
             "response_time": None  # To be filled by caller if available
         }
     
-    def _analyze_linguistic_features(self, response: str) -> Dict[str, Any]:
-        """Analyze linguistic features of the response."""
-        # Convert to lowercase for analysis
-        lower_response = response.lower()
-        
+    def _analyze_linguistic_features(self, lower_response: str) -> Dict[str, Any]:
+        """Analyze linguistic features of the lowercased response."""
         # Uncertainty indicators
-        uncertainty_words = ["maybe", "perhaps", "might", "could", "possibly", 
-                           "not sure", "don't know", "uncertain", "unclear"]
-        uncertainty_count = sum(1 for word in uncertainty_words if word in lower_response)
+        uncertainty_count = _count_keywords(_UNCERTAINTY_RE, lower_response)
         
         # Confidence indicators
-        confidence_words = ["definitely", "certainly", "sure", "confident", 
-                          "clear", "obvious", "understand", "know"]
-        confidence_count = sum(1 for word in confidence_words if word in lower_response)
+        confidence_count = _count_keywords(_CONFIDENCE_RE, lower_response)
         
         # Metacognitive language
-        metacognitive_words = ["think", "believe", "feel", "realize", "understand",
-                             "learned", "discovered", "noticed", "remember"]
-        metacognitive_count = sum(1 for word in metacognitive_words if word in lower_response)
+        metacognitive_count = _count_keywords(_METACOGNITIVE_RE, lower_response)
         
         # Elaboration indicators
-        elaboration_words = ["because", "since", "therefore", "however", "although",
-                           "for example", "such as", "specifically", "in particular"]
-        elaboration_count = sum(1 for phrase in elaboration_words if phrase in lower_response)
+        elaboration_count = _count_keywords(_ELABORATION_RE, lower_response)
         
         return {
             "uncertainty_indicators": uncertainty_count,
             "confidence_indicators": confidence_count,
             "metacognitive_language": metacognitive_count,
             "elaboration_indicators": elaboration_count,
-            "sentiment": self._assess_sentiment(response)
+            "sentiment": self._assess_sentiment(lower_response)
         }
     
-    def _analyze_cognitive_indicators(self, response: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_cognitive_indicators(self, lower_response: str, metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze cognitive processing indicators."""
-        lower_response = response.lower()
-        
         # Deep processing indicators
-        deep_processing = ["analyze", "compare", "evaluate", "synthesize", "relate",
-                         "connect", "integrate", "apply", "transfer"]
-        deep_count = sum(1 for word in deep_processing if word in lower_response)
+        deep_count = _count_keywords(_DEEP_PROCESSING_RE, lower_response)
         
         # Surface processing indicators
-        surface_processing = ["memorize", "repeat", "list", "recall", "remember"]
-        surface_count = sum(1 for word in surface_processing if word in lower_response)
+        surface_count = _count_keywords(_SURFACE_PROCESSING_RE, lower_response)
         
         # Conceptual understanding indicators
-        conceptual_words = ["relationship", "connection", "pattern", "principle",
-                          "concept", "idea", "theory", "model"]
-        conceptual_count = sum(1 for word in conceptual_words if word in lower_response)
+        conceptual_count = _count_keywords(_CONCEPTUAL_RE, lower_response)
         
         return {
             "deep_processing_indicators": deep_count,
             "surface_processing_indicators": surface_count,
             "conceptual_understanding": conceptual_count,
-            "cognitive_load": self._assess_cognitive_load(response)
+            "cognitive_load": self._assess_cognitive_load(lower_response, metrics)
         }
     
-    def _assess_engagement_level(self, response: str) -> str:
+    def _assess_engagement_level(self, lower_response: str, metrics: Dict[str, Any]) -> str:
         """Assess user engagement level based on response characteristics."""
-        metrics = self._calculate_response_metrics(response)
-        
         # High engagement indicators
         if (metrics["word_count"] > 50 or 
             metrics["question_count"] > 1 or
-            "interesting" in response.lower() or
-            "excited" in response.lower()):
+            "interesting" in lower_response or
+            "excited" in lower_response):
             return "high"
         
         # Low engagement indicators
         elif (metrics["word_count"] < 10 or
-              response.lower().strip() in ["yes", "no", "ok", "sure", "maybe"]):
+              lower_response.strip() in ["yes", "no", "ok", "sure", "maybe"]):
             return "low"
         
         return "medium"
     
-    def _assess_scaffolding_needs(self, response: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_scaffolding_needs(self, lower_response: str) -> Dict[str, Any]:
         """Assess what type of scaffolding might be needed based on response."""
-        lower_response = response.lower()
-        scaffolding_type = context.get("scaffolding_type", "")
-        
         needs = {
             "strategic": 0.0,
             "metacognitive": 0.0,
@@ -203,24 +279,16 @@ class InteractionAnalyzer:
         
         return needs
     
-    def _identify_learning_indicators(self, response: str) -> Dict[str, Any]:
+    def _identify_learning_indicators(self, lower_response: str) -> Dict[str, Any]:
         """Identify indicators of learning progress."""
-        lower_response = response.lower()
-        
         # Learning progress indicators
-        progress_indicators = ["learned", "understand", "realize", "see", "get it",
-                             "makes sense", "clear", "aha", "insight"]
-        progress_count = sum(1 for word in progress_indicators if word in lower_response)
+        progress_count = _count_keywords(_PROGRESS_RE, lower_response)
         
         # Confusion indicators
-        confusion_indicators = ["confused", "unclear", "don't understand", "lost",
-                              "difficult", "hard", "complicated"]
-        confusion_count = sum(1 for word in confusion_indicators if word in lower_response)
+        confusion_count = _count_keywords(_CONFUSION_RE, lower_response)
         
         # Knowledge construction indicators
-        construction_indicators = ["connect", "relate", "link", "combine", "integrate",
-                                 "build", "develop", "create"]
-        construction_count = sum(1 for word in construction_indicators if word in lower_response)
+        construction_count = _count_keywords(_CONSTRUCTION_RE, lower_response)
         
         return {
             "progress_indicators": progress_count,
@@ -229,16 +297,10 @@ class InteractionAnalyzer:
             "learning_state": self._determine_learning_state(progress_count, confusion_count)
         }
     
-    def _assess_sentiment(self, response: str) -> str:
+    def _assess_sentiment(self, lower_response: str) -> str:
         """Simple sentiment analysis."""
-        positive_words = ["good", "great", "excellent", "like", "enjoy", "interesting",
-                         "helpful", "useful", "clear", "understand"]
-        negative_words = ["bad", "difficult", "hard", "confusing", "unclear", "frustrated",
-                         "don't like", "boring", "useless"]
-        
-        lower_response = response.lower()
-        positive_count = sum(1 for word in positive_words if word in lower_response)
-        negative_count = sum(1 for word in negative_words if word in lower_response)
+        positive_count = _count_keywords(_POSITIVE_RE, lower_response)
+        negative_count = _count_keywords(_NEGATIVE_RE, lower_response)
         
         if positive_count > negative_count:
             return "positive"
@@ -246,15 +308,13 @@ class InteractionAnalyzer:
             return "negative"
         return "neutral"
     
-    def _assess_cognitive_load(self, response: str) -> str:
+    def _assess_cognitive_load(self, lower_response: str, metrics: Dict[str, Any]) -> str:
         """Assess cognitive load based on response complexity."""
-        metrics = self._calculate_response_metrics(response)
-        
         # High cognitive load indicators
         if (metrics["word_count"] > 100 or
             metrics["avg_word_length"] > 6 or
-            "complex" in response.lower() or
-            "overwhelming" in response.lower()):
+            "complex" in lower_response or
+            "overwhelming" in lower_response):
             return "high"
         
         # Low cognitive load indicators
@@ -12,13 +12,13 @@ from typing import Dict, List, Any, Optional
 from MAS.utils.scaffolding_utils import (
     analyze_concept_map,
     select_scaffolding_type,
-    generate_default_prompts 
+    generate_default_prompts,
+    render_template
 )
 from MAS.config.scaffolding_config import (
-    SCAFFOLDING_PROMPT_TEMPLATES,
     SCAFFOLDING_FOLLOWUP_TEMPLATES,
     SCAFFOLDING_CONCLUSION_TEMPLATES,
-    DEFAULT_SCAFFOLDING_INTENSITY
+    DEFAULT_INTENSITY
 )
 
 logger = logging.getLogger(__name__)
@@ -398,7 +398,7 @@ class ScaffoldingEngine:
                 return scaffolding_needs[scaffolding_type]
         
         # Otherwise, use default intensity
-        return DEFAULT_SCAFFOLDING_INTENSITY.get(scaffolding_type, "medium")
+        return DEFAULT_INTENSITY
     
     def _needs_follow_up(self, response: str) -> bool:
         """
@@ -642,35 +642,31 @@ class ScaffoldingEngine:
         template = random.choice(templates)
         
         # Format template with interaction data
-        try:
-            # Prepare formatting data
-            format_data = {}
-            
-            # Add specific data based on scaffolding type
-            if scaffolding_type == "strategic":
-                format_data["specific_approach"] = "hierarchical relationships" if random.random() < 0.5 else "thematic grouping"
-            
-            elif scaffolding_type == "conceptual":
-                # Get concepts from map analysis
-                map_analysis = interaction.get("map_analysis", {})
-                central_concepts = map_analysis.get("central_concepts", [])
-                
-                if central_concepts and len(central_concepts) >= 2:
-                    format_data["concept_1"] = central_concepts[0].get("label", "key concepts")
-                    format_data["concept_2"] = central_concepts[1].get("label", "related concepts")
-                    format_data["key_concept"] = central_concepts[0].get("label", "the central concept")
-                else:
-                    format_data["concept_1"] = "key concepts"
-                    format_data["concept_2"] = "related concepts"
-                    format_data["key_concept"] = "the central concept"
-            
-            # Format the template
-            conclusion = template.format(**format_data)
-            
-            return conclusion
-        except KeyError:
-            # If formatting fails, return the template as is
-            return template
+        # Prepare formatting data
+        format_data = {}
+        
+        # Add specific data based on scaffolding type
+        if scaffolding_type == "strategic":
+            format_data["specific_approach"] = "hierarchical relationships" if random.random() < 0.5 else "thematic grouping"
+        
+        elif scaffolding_type == "conceptual":
+            # Get concepts from map analysis
+            map_analysis = interaction.get("map_analysis", {})
+            central_concepts = map_analysis.get("central_concepts", [])
+            
+            if central_concepts and len(central_concepts) >= 2:
+                format_data["concept_1"] = central_concepts[0].get("label", "key concepts")
+                format_data["concept_2"] = central_concepts[1].get("label", "related concepts")
+                format_data["key_concept"] = central_concepts[0].get("label", "the central concept")
+            else:
+                format_data["concept_1"] = "key concepts"
+                format_data["concept_2"] = "related concepts"
+                format_data["key_concept"] = "the central concept"
+        
+        # Format the template; placeholders without data stay as written
+        conclusion = render_template(template, **format_data)
+        
+        return conclusion
     
     def _adapt_scaffolding_intensity(self, 
                                     responses: List[str],
@@ -5,8 +5,6 @@ from pymongo import DESCENDING
 from pymongo.mongo_client import MongoClient
 from datetime import datetime
 
-from streamlit.runtime.state import session_state_proxy
-
 from MAS.database.dtos import *
 
 load_dotenv()
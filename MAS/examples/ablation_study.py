@@ -14,6 +14,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from MAS.mas_system import MultiAgentScaffoldingSystem
 from utils.visualization import plot_concept_map
+from examples.example_utils import print_agent_feedback
 
 # Sample concept map data for testing
 SAMPLE_CONCEPT_MAP = {
@@ -230,12 +231,7 @@ def run_experiment(config, experiment_name):
     # Print feedback from agents
     print("\n--- Agent Feedback ---\n")
     
-    responses = result.get("agent_responses", {})
-    for agent_type, response in responses.items():
-        if response:
-            print(f"[{agent_type.replace('_', ' ').title()}]\n")
-            print(response)
-            print("\n" + "-" * 80 + "\n")
+    print_agent_feedback(result.get("agent_responses", {}))
     
     # Increment round counter
     system.session_state["current_round"] += 1
@@ -261,12 +257,7 @@ def run_experiment(config, experiment_name):
     # Print summary feedback from agents
     print("\n--- Summary Feedback ---\n")
     
-    responses = result.get("agent_responses", {})
-    for agent_type, response in responses.items():
-        if response:
-            print(f"[{agent_type.replace('_', ' ').title()}]\n")
-            print(response)
-            print("\n" + "-" * 80 + "\n")
+    print_agent_feedback(result.get("agent_responses", {}))
     
     # Generate session log
     system._generate_session_log()
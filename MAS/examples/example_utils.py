@@ -0,0 +1,23 @@
+"""
+Example Utilities
+
+This module contains helpers shared by the example scripts.
+"""
+
+import sys
+
+def print_agent_feedback(responses):
+    """
+    Print each non-empty agent response under its agent heading.
+    
+    The section is written in one go rather than three prints per agent.
+    
+    Args:
+        responses: Mapping of agent type to response
+    """
+    parts = []
+    for agent_type, response in responses.items():
+        if response:
+            parts.append(f"[{agent_type.replace('_', ' ').title()}]\n\n{response}\n\n{'-' * 80}\n\n")
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
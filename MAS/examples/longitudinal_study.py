@@ -166,6 +166,12 @@ EXPERT_CONCEPT_MAP = {
     ]
 }
 
+# Expert map as sets, built once for the coverage checks in analyze_progress;
+# edges are (source, target, relation) triples, matching the learner edge sets
+EXPERT_NODE_SET = frozenset(EXPERT_CONCEPT_MAP["nodes"])
+EXPERT_EDGE_TRIPLES = frozenset((edge["source"], edge["target"], edge.get("relation", ""))
+                                for edge in EXPERT_CONCEPT_MAP["edges"])
+
 # Learner profile
 LEARNER_PROFILE = {
     "id": "learner123",
@@ -380,9 +386,8 @@ def analyze_progress(current_session, previous_sessions):
     removed_edges = previous_edges - current_edges
     
     # Calculate coverage of expert map
-    expert_nodes = set(EXPERT_CONCEPT_MAP["nodes"])
-    expert_edges = {(edge["source"], edge["target"], edge.get("relation", "")) 
-                   for edge in EXPERT_CONCEPT_MAP["edges"]}
+    expert_nodes = EXPERT_NODE_SET
+    expert_edges = EXPERT_EDGE_TRIPLES
     
     node_coverage = len(set(current_session["data"]["nodes"]) & expert_nodes) / len(expert_nodes)
     edge_coverage = len(current_edges & expert_edges) / len(expert_edges)
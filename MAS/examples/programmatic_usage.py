@@ -14,6 +14,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from MAS.mas_system import MultiAgentScaffoldingSystem
 from utils.visualization import plot_concept_map
+from examples.example_utils import print_agent_feedback
 
 def create_sample_config():
     """
@@ -239,12 +240,7 @@ def main():
     # Print feedback from agents
     print("\n--- Agent Feedback ---\n")
     
-    responses = result.get("agent_responses", {})
-    for agent_type, response in responses.items():
-        if response:
-            print(f"[{agent_type.replace('_', ' ').title()}]\n")
-            print(response)
-            print("\n" + "-" * 80 + "\n")
+    print_agent_feedback(result.get("agent_responses", {}))
     
     # Increment round counter
     system.session_state["current_round"] += 1
@@ -265,12 +261,7 @@ def main():
     # Print summary feedback from agents
     print("\n--- Summary Feedback ---\n")
     
-    responses = result.get("agent_responses", {})
-    for agent_type, response in responses.items():
-        if response:
-            print(f"[{agent_type.replace('_', ' ').title()}]\n")
-            print(response)
-            print("\n" + "-" * 80 + "\n")
+    print_agent_feedback(result.get("agent_responses", {}))
     
     # Generate session log
     system._generate_session_log()
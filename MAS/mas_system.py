@@ -5,6 +5,7 @@ This module provides the main system class for the multi-agent scaffolding syste
 It initializes the system, creates the agents, and handles the interaction flow.
 """
 
+import copy
 import json
 import logging
 import os
@@ -13,7 +14,7 @@ import time
 import random
 import csv
 import threading
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime
 
 import sys
@@ -23,8 +24,6 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from MAS.agents.agent_factory import create_agents_from_config
 from MAS.agents.base_agent import BaseAgent
 from MAS.utils.logging_utils import setup_logging, SessionLogger
-from MAS.utils.pdf_parser import parse_pdf_to_json
-from MAS.utils.visualization import plot_concept_map
 from MAS.utils.ai_api import AIManager
 from MAS.utils.mermaid_parser import MermaidParser
 from MAS.utils.session_timer import RoundManager
@@ -32,8 +31,19 @@ from MAS.core.scaffolding_engine import ScaffoldingEngine
 from MAS.core.dialogue_manager import DialogueManager
 from MAS.core.enhanced_io_manager import create_experimental_handlers, ExperimentalIOManager
 
+# orjson is optional; its decode error subclasses json.JSONDecodeError
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Parsed config files keyed by absolute path -> (mtime_ns, config). The
+# Streamlit app builds a system per session from the same config.json.
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
 class MultiAgentScaffoldingSystem:
     """
     Main system class for the multi-agent scaffolding system.
@@ -172,10 +182,18 @@ class MultiAgentScaffoldingSystem:
             The loaded configuration
         """
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            path = os.path.abspath(config_path)
+            mtime_ns = os.stat(path).st_mtime_ns
+            cached = _CONFIG_CACHE.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                config = cached[1]
+            else:
+                with open(path, 'rb') as f:
+                    config = _json_loads(f.read())
+                _CONFIG_CACHE[path] = (mtime_ns, config)
             logger.info(f"Loaded configuration from {config_path}")
-            return config
+            # Each system gets its own copy so the cached dict stays pristine
+            return copy.deepcopy(config)
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             # Return default configuration
@@ -275,6 +293,12 @@ class MultiAgentScaffoldingSystem:
         """
         logger.info(f"Processing concept map: {pdf_path}")
         
+        # PDF parsing and plotting pull in pdfplumber/PyPDF2 and matplotlib;
+        # import them here so loading the system (e.g. from the Streamlit app)
+        # does not pay for them.
+        from MAS.utils.pdf_parser import parse_pdf_to_json
+        from MAS.utils.visualization import plot_concept_map
+        
         try:
             # Parse PDF to JSON
             concept_map_data = parse_pdf_to_json(pdf_path)
@@ -456,6 +480,7 @@ class MultiAgentScaffoldingSystem:
         """
         # Set active agent for this round
         agent_type = self.agent_sequence[round_number]
+        agent_name = agent_type.replace('_', ' ').title()
         self.set_active_agent(agent_type)
         
         # Start round timer
@@ -465,7 +490,7 @@ class MultiAgentScaffoldingSystem:
             self.round_manager.timer.start_round(round_number, self._handle_round_timeout)
         
         print(f"\n=== Round {round_number + 1} ===")
-        print(f"Active Agent: {agent_type.replace('_', ' ').title()}")
+        print(f"Active Agent: {agent_name}")
         print(f"Time Limit: 7 minutes")
         
         # Initialize round data
@@ -494,7 +519,7 @@ class MultiAgentScaffoldingSystem:
             "tokens_used": api_result.get("tokens_used")
         })
         
-        print(f"\n🤖 {agent_type.replace('_', ' ').title()} Agent:")
+        print(f"\n🤖 {agent_name} Agent:")
         print(initial_response)
         
         # Interaction loop
@@ -532,7 +557,7 @@ class MultiAgentScaffoldingSystem:
                 "tokens_used": api_result.get("tokens_used")
             })
             
-            print(f"\n🤖 {agent_type.replace('_', ' ').title()} Agent:")
+            print(f"\n🤖 {agent_name} Agent:")
             print(agent_followup)
             
             # Check for time remaining
@@ -578,6 +603,14 @@ class MultiAgentScaffoldingSystem:
         
         print(f"🧪 Starting experimental session for participant: {participant_id}")
         
+        # Importing readline gives input() line editing and arrow-key recall,
+        # so participants can fix or reuse a Mermaid line instead of retyping
+        # it. No history file is kept: the entries are participant data.
+        try:
+            import readline  # noqa: F401
+        except ImportError:
+            pass
+        
         # Initialize session
         self.participant_id = participant_id
         self.initialize_agent_sequence(participant_id)
@@ -4,12 +4,28 @@ Multi-Agent Scaffolding System - Utils Package
 This package contains utility modules for the multi-agent scaffolding system.
 """
 
-from .pdf_parser import parse_pdf_to_json
-from .visualization import plot_concept_map
+import importlib
+
 from .logging_utils import setup_logging
 
+# PDF parsing and plotting pull in pdfplumber/PyPDF2 and matplotlib/networkx,
+# so their helpers are only imported on first access (PEP 562).
+_LAZY_EXPORTS = {
+    'parse_pdf_to_json': '.pdf_parser',
+    'plot_concept_map': '.visualization'
+}
+
 __all__ = [
     'parse_pdf_to_json',
     'plot_concept_map',
     'setup_logging'
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
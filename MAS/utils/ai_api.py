@@ -201,14 +201,14 @@ class AIManager:
         try:
             from MAS.utils.scaffolding_utils import generate_default_prompts
             from MAS.config.scaffolding_config import (
-                SCAFFOLDING_PROMPT_TEMPLATES,
+                SCAFFOLDING_PROMPTS_BY_LEVEL,
                 SCAFFOLDING_FOLLOWUP_TEMPLATES,
                 SCAFFOLDING_CONCLUSION_TEMPLATES
             )
         except ImportError:
             from utils.scaffolding_utils import generate_default_prompts
             from config.scaffolding_config import (
-                SCAFFOLDING_PROMPT_TEMPLATES,
+                SCAFFOLDING_PROMPTS_BY_LEVEL,
                 SCAFFOLDING_FOLLOWUP_TEMPLATES,
                 SCAFFOLDING_CONCLUSION_TEMPLATES
             )
@@ -241,7 +241,7 @@ class AIManager:
         else:
             # Use initial scaffolding templates
             intensity = "high" if scaffolding_level == "high" else "medium"
-            templates = SCAFFOLDING_PROMPT_TEMPLATES.get(scaffolding_type, {}).get(intensity, [])
+            templates = SCAFFOLDING_PROMPTS_BY_LEVEL.get((scaffolding_type, intensity), ())
             
             if templates:
                 # Generate prompts using the utility function with correct signature
@@ -288,17 +288,6 @@ class AIManager:
     def _get_scaffolding_system_message(self, scaffolding_type: str, scaffolding_level: str = "medium") -> str:
         """Get system message for specific scaffolding type and level."""
         
-        # Import scaffolding templates
-        try:
-            from MAS.config.amg_scaffolding_config import AMG_SCAFFOLDING_PROMPT_TEMPLATES
-        except ImportError:
-            # Fallback if import fails
-            try:
-                from config.amg_scaffolding_config import AMG_SCAFFOLDING_PROMPT_TEMPLATES
-            except ImportError:
-                # Use default templates if AMG not available
-                from MAS.config.scaffolding_config import SCAFFOLDING_PROMPT_TEMPLATES as AMG_SCAFFOLDING_PROMPT_TEMPLATES
-        
         base_messages = {
             "conceptual": f"""You are a Conceptual Scaffolding Agent for the Adaptive Market Gatekeeping (AMG) international market entry task.
 
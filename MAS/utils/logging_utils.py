@@ -9,6 +9,7 @@ import json
 import csv
 import logging
 import datetime
+import tempfile
 from typing import Dict, List, Any, Optional, Union
 
 # Configure basic logging
@@ -19,6 +20,10 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Arguments of the last setup_logging call; a system is built per session,
+# and repeating the same setup would only churn handlers and log files.
+_logging_setup = None
+
 def setup_logging(log_dir: str = "logs", log_level: str = "INFO", log_to_file: bool = True) -> logging.Logger:
     """
     Set up logging configuration for the application.
@@ -31,13 +36,18 @@ def setup_logging(log_dir: str = "logs", log_level: str = "INFO", log_to_file: b
     Returns:
         Configured logger
     """
-    # Create log directory if it doesn't exist
-    if log_to_file:
-        os.makedirs(log_dir, exist_ok=True)
+    global _logging_setup
     
     # Get root logger
     root_logger = logging.getLogger()
     
+    if _logging_setup == (log_dir, log_level, log_to_file):
+        return root_logger
+    
+    # Create log directory if it doesn't exist
+    if log_to_file:
+        os.makedirs(log_dir, exist_ok=True)
+    
     # Set log level
     level = getattr(logging, log_level.upper())
     root_logger.setLevel(level)
@@ -45,6 +55,7 @@ def setup_logging(log_dir: str = "logs", log_level: str = "INFO", log_to_file: b
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
     
     # Create console handler
     console_handler = logging.StreamHandler()
@@ -63,6 +74,8 @@ def setup_logging(log_dir: str = "logs", log_level: str = "INFO", log_to_file: b
         file_handler.setFormatter(file_formatter)
         root_logger.addHandler(file_handler)
     
+    _logging_setup = (log_dir, log_level, log_to_file)
+    
     logger.info(f"Logging configured with level {log_level}")
     if log_to_file:
         logger.info(f"Logging to file: {log_file}")
@@ -366,9 +379,23 @@ class SessionLogger:
         """
         Write log entries to the log file.
         """
-        # Write to JSON log file
-        with open(self.json_log_path, 'w') as f:
-            json.dump(self.log_entries, f, indent=2)
+        # Write to JSON log file. The whole log is rewritten on every entry,
+        # so write a temp file and swap it in; a crash mid-write then leaves
+        # the previous complete log instead of a truncated one. The temp name
+        # is unique per write so concurrent writers never share a file.
+        log_dir = os.path.dirname(self.json_log_path) or "."
+        with tempfile.NamedTemporaryFile(
+            'w', dir=log_dir, prefix=os.path.basename(self.json_log_path) + ".",
+            suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            try:
+                json.dump(self.log_entries, f, indent=2)
+            except BaseException:
+                f.close()
+                os.remove(tmp_path)
+                raise
+        os.replace(tmp_path, self.json_log_path)
         
         # Write to CSV log file if format is CSV
         if self.format == "csv":
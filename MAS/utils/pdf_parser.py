@@ -97,7 +97,8 @@ class PDFParser:
             self.last_parsed_data = graph_data
             
             logger.info(f"Successfully parsed PDF: {pdf_path}")
-            logger.debug(f"Extracted graph data: {json.dumps(graph_data)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extracted graph data: {json.dumps(graph_data)}")
             
             return graph_data
             
@@ -214,12 +215,12 @@ class PDFParser:
         Returns:
             Graph data dictionary
         """
-        if not os.path.exists(json_path):
+        try:
+            with open(json_path, 'r') as f:
+                graph_data = json.load(f)
+        except FileNotFoundError:
             logger.error(f"JSON file not found: {json_path}")
             raise FileNotFoundError(f"JSON file not found: {json_path}")
         
-        with open(json_path, 'r') as f:
-            graph_data = json.load(f)
-        
         logger.info(f"Loaded graph data from {json_path}")
         return graph_data
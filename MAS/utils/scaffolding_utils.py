@@ -6,10 +6,16 @@ This module provides utility functions for scaffolding in the multi-agent scaffo
 
 import logging
 import random
-from typing import Dict, List, Any, Optional, Tuple
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Template placeholders such as {observation} or {node_count}
+_TEMPLATE_FIELD_RE = re.compile(r"\{(\w+)\}")
+
 def analyze_concept_map(concept_map: Dict[str, Any],
                        previous_map: Optional[Dict[str, Any]] = None,
                        expert_map: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -316,7 +322,7 @@ def generate_default_prompts(scaffolding_type: str,
     Returns:
         Tuple of (List of scaffolding prompts, List of template indices used)
     """
-    from MAS.config.scaffolding_config import SCAFFOLDING_PROMPT_TEMPLATES
+    from MAS.config.scaffolding_config import SCAFFOLDING_PROMPTS_BY_LEVEL
     
     # Initialize used indices if not provided
     if used_template_indices is None:
@@ -327,11 +333,11 @@ def generate_default_prompts(scaffolding_type: str,
         scaffolding_intensity = "medium"
     
     # Get available templates for this type and intensity
-    available_templates = SCAFFOLDING_PROMPT_TEMPLATES.get(scaffolding_type, {}).get(scaffolding_intensity, [])
+    available_templates = SCAFFOLDING_PROMPTS_BY_LEVEL.get((scaffolding_type, scaffolding_intensity), ())
     
     if not available_templates:
         # Fallback to medium if high not available
-        available_templates = SCAFFOLDING_PROMPT_TEMPLATES.get(scaffolding_type, {}).get("medium", [])
+        available_templates = SCAFFOLDING_PROMPTS_BY_LEVEL.get((scaffolding_type, "medium"), ())
     
     # Filter out already used templates
     unused_indices = [i for i in range(len(available_templates)) if i not in used_template_indices]
@@ -564,23 +570,25 @@ def _select_best_template_index(unused_indices: List[int],
         
         # Check for placeholders that can be filled
         if analysis:
-            if "{observation}" in template and analysis.get("isolated_nodes"):
+            fields = _template_fields(template)
+            if "observation" in fields and analysis.get("isolated_nodes"):
                 score += 2
-            if "{node_count}" in template and "node_count" in analysis:
+            if "node_count" in fields and "node_count" in analysis:
                 score += 1
-            if "{edge_count}" in template and "edge_count" in analysis:
+            if "edge_count" in fields and "edge_count" in analysis:
                 score += 1
-            if "{concept}" in template and analysis.get("central_nodes"):
+            if "concept" in fields and analysis.get("central_nodes"):
                 score += 2
         
         # Prefer templates appropriate for conversation turn
+        template_lower = template.lower()
         if conversation_turn == 0:
             # First turn: prefer broader questions
-            if "overall" in template.lower() or "approach" in template.lower():
+            if "overall" in template_lower or "approach" in template_lower:
                 score += 2
         else:
             # Later turns: prefer more specific questions
-            if "specific" in template.lower() or "particular" in template.lower():
+            if "specific" in template_lower or "particular" in template_lower:
                 score += 2
         
         template_scores[idx] = score
@@ -590,6 +598,84 @@ def _select_best_template_index(unused_indices: List[int],
     return sorted_indices[0] if sorted_indices else unused_indices[0]
 
 
+@lru_cache(maxsize=None)
+def _compile_template(template: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Split a template into its literal segments and placeholder names.
+    
+    Templates are module-level constants, so the cache is bounded by the
+    number of distinct template strings.
+    
+    Args:
+        template: Template string with placeholders
+        
+    Returns:
+        Tuple of (literal segments, field names); there is always one more
+        literal segment than field name
+    """
+    # Interned, so segments repeated across templates (". ", "", field
+    # names) share one object and field lookups hit the identity fast path
+    parts = [sys.intern(part) for part in _TEMPLATE_FIELD_RE.split(template)]
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+def _render_template(compiled: Tuple[Tuple[str, ...], Tuple[str, ...]],
+                     values: Dict[str, str]) -> str:
+    """
+    Render a compiled template in a single join.
+    
+    Placeholders without a value are kept as written.
+    
+    Args:
+        compiled: Result of _compile_template
+        values: Replacement text by field name
+        
+    Returns:
+        Rendered string
+    """
+    literals, fields = compiled
+    parts = [literals[0]]
+    for field, literal in zip(fields, literals[1:]):
+        value = values.get(field)
+        parts.append("{" + field + "}" if value is None else value)
+        parts.append(literal)
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _template_fields(template: str) -> FrozenSet[str]:
+    """
+    Get the set of placeholder names a template uses.
+    
+    Args:
+        template: Template string with placeholders
+        
+    Returns:
+        Field names, e.g. frozenset({"observation", "concept"})
+    """
+    return frozenset(_compile_template(template)[1])
+
+
+def render_template(template: str, **values: Any) -> str:
+    """
+    Fill the {field} placeholders of a scaffolding template.
+    
+    Unlike str.format, placeholders without a value are kept as written
+    instead of raising KeyError.
+    
+    Args:
+        template: Template string with placeholders
+        **values: Replacement values by field name
+        
+    Returns:
+        Rendered string
+    """
+    return _render_template(
+        _compile_template(template),
+        {field: str(value) for field, value in values.items()}
+    )
+
+
 def _fill_template_with_context(template: str,
                                analysis: Optional[Dict[str, Any]],
                                enhanced_concept_map: Optional[Dict[str, Any]]) -> str:
@@ -604,31 +690,32 @@ def _fill_template_with_context(template: str,
     Returns:
         Filled template string
     """
-    filled = template
+    compiled = _compile_template(template)
+    fields = compiled[1]
     
-    if analysis:
-        # Fill basic counts
-        if "{node_count}" in filled:
-            filled = filled.replace("{node_count}", str(analysis.get("node_count", 0)))
-        if "{edge_count}" in filled:
-            filled = filled.replace("{edge_count}", str(analysis.get("edge_count", 0)))
-        
-        # Fill observations
-        if "{observation}" in filled:
-            observation = _generate_observation(analysis, enhanced_concept_map)
-            filled = filled.replace("{observation}", observation)
-        
-        # Fill concept references
-        if "{concept}" in filled or "{another_concept}" in filled:
-            concepts = _get_concept_labels(enhanced_concept_map)
-            if concepts:
-                filled = filled.replace("{concept}", concepts[0] if concepts else "a key concept")
-                if "{another_concept}" in filled and len(concepts) > 1:
-                    filled = filled.replace("{another_concept}", concepts[1])
-                elif "{another_concept}" in filled:
-                    filled = filled.replace("{another_concept}", "another concept")
-    
-    return filled
+    if not analysis or not fields:
+        return template
+    
+    values = {}
+    
+    # Fill basic counts
+    if "node_count" in fields:
+        values["node_count"] = str(analysis.get("node_count", 0))
+    if "edge_count" in fields:
+        values["edge_count"] = str(analysis.get("edge_count", 0))
+    
+    # Fill observations
+    if "observation" in fields:
+        values["observation"] = _generate_observation(analysis, enhanced_concept_map)
+    
+    # Fill concept references
+    if "concept" in fields or "another_concept" in fields:
+        concepts = _get_concept_labels(enhanced_concept_map)
+        if concepts:
+            values["concept"] = concepts[0]
+            values["another_concept"] = concepts[1] if len(concepts) > 1 else "another concept"
+    
+    return _render_template(compiled, values)
 
 
 def _generate_observation(analysis: Dict[str, Any], 